@@ -1,18 +1,25 @@
 """Markdown conversion utilities for various content types using MarkItDown."""
 
+import hashlib
+import io
+import json
 import logging
 import re
 import tempfile
 import os
-from typing import Dict, Any, List, Optional, Union
-from urllib.parse import urljoin, urlparse
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional, Union
+from urllib.parse import urljoin, urlparse, urlsplit
 from pathlib import Path
 
 try:
-    from markitdown import MarkItDown
+    from markitdown import MarkItDown, StreamInfo
+    from markitdown.converters import HtmlConverter
 except ImportError:
     # Fallback for testing or if markitdown is not available
     MarkItDown = None
+    StreamInfo = None
+    HtmlConverter = None
 
 from bs4 import BeautifulSoup, Comment
 import base64
@@ -21,12 +28,95 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# BeautifulSoup tree builder for preprocessing and content extraction: lxml is
+# a C parser and much faster than the pure-Python "html.parser"
+_HTML_PARSER = "lxml"
+
+# Number of converted documents kept per converter instance
+_CONVERSION_CACHE_SIZE = 256
+
+# Elements that typically don't contain main content
+_UNWANTED_TAGS = (
+    "script",
+    "style",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "advertisement",
+    "ads",
+)
+
+# Cheap test for any class/id attribute worth running the ad/nav filter on
+_CLASS_OR_ID_ATTR_RE = re.compile(r"\s(?:class|id)\s*=", re.IGNORECASE)
+
+# <a>/<img> start tags (quoted attribute values may contain ">") and the
+# attribute values inside them; every name=value pair is matched whole so an
+# "href=" inside another attribute's quoted value is never mistaken for one
+_URL_TAG_RE = re.compile(r"""<(a|img)\b(?:[^>"']|"[^"]*"|'[^']*')*>""", re.IGNORECASE)
+_URL_ATTR_RE = re.compile(
+    r"""(\s([^\s"'>/=]+)\s*=\s*)(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))"""
+)
+
+# Root-relative paths that urljoin would leave untouched (no dot segments or
+# params/query/fragment for it to normalise)
+_PLAIN_ROOT_PATH_RE = re.compile(r"/(?!/)[^;?#\s]*\Z")
+
+# Class/id values that mark ads, navigation and other page chrome
+_UNWANTED_ATTR_RE = re.compile(
+    r".*(ad|advertisement|sidebar|nav|menu|footer|header).*", re.I
+)
+
+# Patterns used by the Markdown post-processing passes
+_TABLE_SEPARATOR_RE = re.compile(r"^\s*\|[\s\-:]+\|\s*$")
+_IMAGE_RE = re.compile(r"!\[(.*?)\]\((.*?)\)")
+_IMAGE_SPACING_RE = re.compile(r"(!\[.*?\]\(.*?\))")
+_LINK_SPACING_RE = re.compile(r"\[([^\]]+)\]\s*\(\s*([^\s\)]+)\s*\)")
+_LINK_LINEBREAK_RE = re.compile(r"\[([^\]]+)\]\s*\n\s*\(([^\)]+)\)")
+# Fenced code blocks without a language hint
+_BARE_CODE_BLOCK_RE = re.compile(
+    r"^(\s*)```\s*\n((?:(?!```).)*?)^\1```", re.MULTILINE | re.DOTALL
+)
+# Language signatures in priority order: a lowercase substring that must be
+# present, then an optional pattern that confirms the match
+_CODE_LANGUAGE_SIGNATURES = (
+    ("def", re.compile(r"def\s+\w+", re.IGNORECASE), "python"),
+    ("function", re.compile(r"function\s+\w+", re.IGNORECASE), "javascript"),
+    ("class", re.compile(r"class\s+\w+", re.IGNORECASE), "python"),
+    ("import", re.compile(r"import\s+", re.IGNORECASE), "python"),
+    ("<?php", None, "php"),
+    ("<html", None, "html"),
+    ("select", re.compile(r"SELECT\s+", re.IGNORECASE), "sql"),
+)
+_CODE_BLOCK_SPACING_RE = re.compile(r"(```[a-z]*\n.*?\n```)", re.DOTALL)
+_QUOTE_MARKER_RE = re.compile(r"^(\s*)>\s*(.+)$", re.MULTILINE)
+_QUOTE_SPACING_RE = re.compile(r"(^>.+$)", re.MULTILINE)
+_BULLET_ITEM_RE = re.compile(r"^(\s*)([-\*\+])\s*(.+)$")
+_NUMBERED_ITEM_RE = re.compile(r"^(\s*)(\d+)[\.\)]\s*(.+)$")
+_EMPTY_LIST_ITEM_RE = re.compile(r"\n[-*+]\s*\n(?=\n)")
+_HEADING_RE = re.compile(r"^#{1,6}\s")
+_DOUBLE_HYPHEN_RE = re.compile(r"(?<!\-)\-\-(?!\-)")
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+(?=[.!?:;,])")
+_SENTENCE_SPACING_RE = re.compile(r"([.!?])\s*(?=[A-Z])")
+
+
+def _html_digest(html_content: str) -> bytes:
+    """Return a compact digest of HTML content for keying cached conversions."""
+    return hashlib.blake2b(
+        html_content.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
 
 class MarkdownConverter:
     """Convert various content types to Markdown format using Microsoft's MarkItDown."""
 
     def __init__(
-        self, enable_plugins: bool = False, llm_client=None, llm_model: str = None
+        self,
+        enable_plugins: bool = False,
+        llm_client=None,
+        llm_model: str = None,
+        cache_dir: Optional[str] = None,
     ):
         """
         Initialize the Markdown converter.
@@ -35,15 +125,30 @@ class MarkdownConverter:
             enable_plugins: Whether to enable MarkItDown plugins
             llm_client: Optional LLM client for enhanced image descriptions
             llm_model: LLM model to use (e.g., "gpt-4o")
+            cache_dir: Directory for the opt-in on-disk webpage conversion cache
         """
         if MarkItDown is None:
             raise ImportError(
                 "MarkItDown is not available. Please install it with: pip install 'markitdown[all]'"
             )
 
-        self.markitdown = MarkItDown(
-            enable_plugins=enable_plugins, llm_client=llm_client, llm_model=llm_model
-        )
+        # The full MarkItDown instance (format detection, plugin loading) is
+        # only needed for non-HTML sources, so it is built on first use
+        self._markitdown = None
+
+        # Input to html_to_markdown is always HTML, so without plugins that may
+        # claim it, MarkItDown's format detection and dispatch can be skipped
+        self._html_converter = None if enable_plugins else HtmlConverter()
+
+        # Settings for the lazily created MarkItDown instance
+        self._enable_plugins = enable_plugins
+        self._llm_client = llm_client
+        self._llm_model = llm_model
+
+        # On-disk cache of webpage conversions, used when callers pass use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # Configuration options for different conversion scenarios
         self.default_options = {
@@ -67,6 +172,41 @@ class MarkdownConverter:
             "fix_spacing": True,
         }
 
+        # LRU caches of recent results so repeated pages skip parsing entirely
+        self._content_area_cache: OrderedDict = OrderedDict()
+        self._markdown_cache: OrderedDict = OrderedDict()
+
+    @property
+    def markitdown(self) -> "MarkItDown":
+        """MarkItDown instance used for PDF and plugin-backed conversions."""
+        if self._markitdown is None:
+            self._markitdown = MarkItDown(
+                enable_plugins=self._enable_plugins,
+                llm_client=self._llm_client,
+                llm_model=self._llm_model,
+            )
+        return self._markitdown
+
+    @markitdown.setter
+    def markitdown(self, value: "MarkItDown") -> None:
+        self._markitdown = value
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: Any) -> Optional[str]:
+        """Return a cached value and mark it as most recently used."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _cache_set(cache: OrderedDict, key: Any, value: str) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _CONVERSION_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def html_to_markdown(
         self,
         html_content: str,
@@ -85,38 +225,99 @@ class MarkdownConverter:
             Markdown formatted content
         """
         try:
+            # Output depends on the formatting options, so they are part of the key
+            cache_key = (
+                _html_digest(html_content),
+                base_url,
+                tuple(self.formatting_options.items()),
+            )
+            cached = self._cache_get(self._markdown_cache, cache_key)
+            if cached is not None:
+                return cached
+
             # Preprocess HTML if needed
             processed_html = self.preprocess_html(html_content, base_url)
 
-            # Create a temporary HTML file for MarkItDown to process
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".html", delete=False, encoding="utf-8"
-            ) as temp_file:
-                temp_file.write(processed_html)
-                temp_file_path = temp_file.name
-
-            try:
-                # Convert using MarkItDown
-                result = self.markitdown.convert(temp_file_path)
-                markdown_content = result.text_content
-
-                # Post-process the markdown for better formatting
-                markdown_content = self.postprocess_markdown(markdown_content)
-
-                return markdown_content
+            markdown_content = self._convert_preprocessed_html(processed_html)
 
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except OSError:
-                    pass
+            self._cache_set(self._markdown_cache, cache_key, markdown_content)
+            return markdown_content
 
         except Exception as e:
             logger.error(f"Error converting HTML to Markdown with MarkItDown: {str(e)}")
             # Fallback to basic conversion if MarkItDown fails
             return self._fallback_html_conversion(html_content)
 
+    def _convert_preprocessed_html(self, processed_html: str) -> str:
+        """Run MarkItDown and the Markdown post-processing on cleaned HTML."""
+        # Encode once and hand MarkItDown an in-memory stream instead of
+        # round-tripping the document through a temporary file on disk.
+        html_stream = io.BytesIO(processed_html.encode("utf-8"))
+        stream_info = StreamInfo(
+            mimetype="text/html", extension=".html", charset="utf-8"
+        )
+        if self._html_converter is not None:
+            markdown_content = self._html_converter.convert(
+                html_stream, stream_info
+            ).markdown
+        else:
+            markdown_content = self.markitdown.convert_stream(
+                html_stream, stream_info=stream_info
+            ).text_content
+
+        # Post-process the markdown for better formatting
+        return self.postprocess_markdown(markdown_content)
+
+    def _main_content_to_markdown(
+        self,
+        html_content: str,
+        base_url: Optional[str] = None,
+        custom_options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Extract the main content area and convert it to Markdown.
+
+        Equivalent to ``html_to_markdown(extract_content_area(html))`` but the
+        page is parsed once: the content area is cleaned in place in the same
+        tree and serialized only for MarkItDown.
+        """
+        try:
+            cache_key = (
+                _html_digest(html_content),
+                base_url,
+                tuple(self.formatting_options.items()),
+                "main_content",
+            )
+            cached = self._cache_get(self._markdown_cache, cache_key)
+            if cached is not None:
+                return cached
+
+            # Comments are removed from the parsed tree: a raw-markup regex
+            # would misread "<!--" inside script strings or attribute values
+            has_comments = "<!--" in html_content
+
+            soup = BeautifulSoup(html_content, _HTML_PARSER)
+            content_area = self._find_content_area(soup)
+            if content_area is not soup:
+                # Detach the area into its own document so cleanup also applies
+                # to the area element itself, as it would after re-parsing
+                document = BeautifulSoup("", _HTML_PARSER)
+                document.append(content_area.extract())
+            else:
+                document = soup
+            self._preprocess_soup(document, base_url, remove_comments=has_comments)
+
+            markdown_content = self._convert_preprocessed_html(str(document))
+
+            self._cache_set(self._markdown_cache, cache_key, markdown_content)
+            return markdown_content
+
+        except Exception as e:
+            logger.warning(f"Error converting main content in one pass: {str(e)}")
+            return self.html_to_markdown(
+                self.extract_content_area(html_content), base_url, custom_options
+            )
+
     def _fallback_html_conversion(self, html_content: str) -> str:
         """Fallback HTML conversion when MarkItDown fails."""
         try:
@@ -156,64 +357,134 @@ class MarkdownConverter:
             Preprocessed HTML content
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            # Cheap substring checks decide which passes can have any effect,
+            # so clean documents never pay for a BeautifulSoup parse
+            lowered = html_content.lower()
+            has_comments = "<!--" in lowered
+            has_unwanted_tags = any(f"<{tag}" in lowered for tag in _UNWANTED_TAGS)
+            has_class_or_id = _CLASS_OR_ID_ATTR_RE.search(html_content) is not None
+            has_urls = bool(base_url) and ("href" in lowered or "src" in lowered)
+
+            if not (has_comments or has_unwanted_tags or has_class_or_id):
+                # Only URLs (if anything) need rewriting, which can be done on
+                # the raw markup without a parse/serialize round trip
+                if has_urls:
+                    return self._rewrite_relative_urls(html_content, base_url)
+                return html_content
+
+            soup = BeautifulSoup(html_content, _HTML_PARSER)
+
+            self._preprocess_soup(
+                soup,
+                base_url if has_urls else None,
+                remove_comments=has_comments,
+                remove_unwanted_tags=has_unwanted_tags,
+                remove_unwanted_attrs=has_class_or_id,
+            )
+
+            return str(soup)
 
-            # Remove comments
+        except Exception as e:
+            logger.warning(f"Error preprocessing HTML: {str(e)}")
+            return html_content
+
+    def _preprocess_soup(
+        self,
+        soup: BeautifulSoup,
+        base_url: Optional[str] = None,
+        *,
+        remove_comments: bool = True,
+        remove_unwanted_tags: bool = True,
+        remove_unwanted_attrs: bool = True,
+    ) -> None:
+        """Apply the preprocess_html cleanup passes to a parsed tree in place."""
+        # Remove comments
+        if remove_comments:
             comments = soup.find_all(string=lambda text: isinstance(text, Comment))
             for comment in comments:
                 comment.extract()
 
-            # Remove unwanted elements that typically don't contain main content
-            unwanted_tags = [
-                "script",
-                "style",
-                "nav",
-                "header",
-                "footer",
-                "aside",
-                "advertisement",
-                "ads",
-            ]
-            for tag in unwanted_tags:
-                for element in soup.find_all(tag):
+        # Remove unwanted elements that typically don't contain main content
+        if remove_unwanted_tags:
+            # One traversal for all tag names; elements nested inside an
+            # already removed one are skipped
+            for element in soup.find_all(list(_UNWANTED_TAGS)):
+                if not element.decomposed:
                     element.decompose()
 
-            # Remove elements with specific classes/ids commonly used for ads/navigation
-            unwanted_patterns = [
-                re.compile(
-                    r".*(ad|advertisement|sidebar|nav|menu|footer|header).*", re.I
-                )
-            ]
+        # Remove elements with specific classes/ids commonly used for ads/navigation
+        if remove_unwanted_attrs:
+            for element in soup.find_all(class_=_UNWANTED_ATTR_RE):
+                element.decompose()
+            for element in soup.find_all(id=_UNWANTED_ATTR_RE):
+                element.decompose()
+
+        # Convert relative URLs to absolute if base_url is provided
+        if base_url:
+            join_url = self._make_url_joiner(base_url)
+
+            # Convert relative links
+            for link in soup.find_all("a", href=True):
+                href = link.get("href", "")
+                if isinstance(href, str) and not href.startswith(
+                    ("http://", "https://")
+                ):
+                    link["href"] = join_url(href)
+
+            # Convert relative image sources
+            for img in soup.find_all("img", src=True):
+                src = img.get("src", "")
+                if isinstance(src, str) and not src.startswith(("http://", "https://")):
+                    img["src"] = join_url(src)
+
+    @staticmethod
+    def _make_url_joiner(base_url: str) -> Callable[[str], str]:
+        """Return a memoized urljoin bound to one base URL."""
+        base = urlsplit(base_url)
+        # Root-relative paths only need the origin prepended
+        origin = (
+            f"{base.scheme}://{base.netloc}"
+            if base.scheme in ("http", "https") and base.netloc
+            else None
+        )
+        joined: Dict[str, str] = {}
 
-            for pattern in unwanted_patterns:
-                for element in soup.find_all(class_=pattern):
-                    element.decompose()
-                for element in soup.find_all(id=pattern):
-                    element.decompose()
+        def join_url(url: str) -> str:
+            result = joined.get(url)
+            if result is None:
+                if origin and _PLAIN_ROOT_PATH_RE.match(url) and "/." not in url:
+                    result = origin + url
+                else:
+                    result = urljoin(base_url, url)
+                joined[url] = result
+            return result
 
-            # Convert relative URLs to absolute if base_url is provided
-            if base_url:
-                # Convert relative links
-                for link in soup.find_all("a", href=True):
-                    href = link.get("href", "")
-                    if isinstance(href, str) and not href.startswith(
-                        ("http://", "https://")
-                    ):
-                        link["href"] = urljoin(base_url, href)
+        return join_url
 
-                # Convert relative image sources
-                for img in soup.find_all("img", src=True):
-                    src = img.get("src", "")
-                    if isinstance(src, str) and not src.startswith(
-                        ("http://", "https://")
-                    ):
-                        img["src"] = urljoin(base_url, src)
+    def _rewrite_relative_urls(self, html_content: str, base_url: str) -> str:
+        """Make <a href> and <img src> values absolute with regex substitution."""
+        join_url = self._make_url_joiner(base_url)
 
-            return str(soup)
+        def rewrite_attr(match: re.Match, wanted: str) -> str:
+            if match.group(2).lower() != wanted:
+                return match.group(0)
+            if match.group(3) is not None:
+                value, quote = match.group(3), '"'
+            elif match.group(4) is not None:
+                value, quote = match.group(4), "'"
+            else:
+                value, quote = match.group(5), ""
+            if value.startswith(("http://", "https://")):
+                return match.group(0)
+            return f"{match.group(1)}{quote}{join_url(value)}{quote}"
+
+        def rewrite_tag(match: re.Match) -> str:
+            wanted = "href" if match.group(1).lower() == "a" else "src"
+            return _URL_ATTR_RE.sub(
+                lambda attr: rewrite_attr(attr, wanted), match.group(0)
+            )
 
-        except Exception as e:
-            logger.warning(f"Error preprocessing HTML: {str(e)}")
-            return html_content
+        return _URL_TAG_RE.sub(rewrite_tag, html_content)
 
     def postprocess_markdown(self, markdown_content: str) -> str:
         """
@@ -268,8 +539,6 @@ class MarkdownConverter:
     ) -> Dict[str, Any]:
         """Embed remote images referenced in Markdown as data URIs."""
         try:
-            pattern = re.compile(r"!\[(.*?)\]\((.*?)\)")
-
             embedded_count = 0
             attempted = 0
             skipped_large = 0
@@ -321,7 +590,7 @@ class MarkdownConverter:
                     skipped_errors += 1
                     return match.group(0)
 
-            new_md = pattern.sub(replacer, markdown_content)
+            new_md = _IMAGE_RE.sub(replacer, markdown_content)
 
             return {
                 "markdown": new_md,
@@ -362,13 +631,11 @@ class MarkdownConverter:
                     cells = [cell.strip() for cell in line.split("|")[1:-1]]
 
                     # Check if next line is a separator (header separator)
-                    if i + 1 < len(lines) and re.match(
-                        r"^\s*\|[\s\-:]+\|\s*$", lines[i + 1]
-                    ):
+                    if i + 1 < len(lines) and _TABLE_SEPARATOR_RE.match(lines[i + 1]):
                         # This is a header row
                         formatted_line = "| " + " | ".join(cells) + " |"
                         formatted_lines.append(formatted_line)
-                    elif re.match(r"^\s*\|[\s\-:]+\|\s*$", line):
+                    elif _TABLE_SEPARATOR_RE.match(line):
                         # This is a separator row
                         separator_cells = []
                         for cell in cells:
@@ -410,12 +677,10 @@ class MarkdownConverter:
 
                 return f"![{alt_text}]({image_url})"
 
-            markdown_content = re.sub(
-                r"!\[(.*?)\]\((.*?)\)", improve_image_alt, markdown_content
-            )
+            markdown_content = _IMAGE_RE.sub(improve_image_alt, markdown_content)
 
             # Add proper spacing around images
-            markdown_content = re.sub(r"(!\[.*?\]\(.*?\))", r"\n\1\n", markdown_content)
+            markdown_content = _IMAGE_SPACING_RE.sub(r"\n\1\n", markdown_content)
 
             return markdown_content
         except Exception as e:
@@ -426,14 +691,10 @@ class MarkdownConverter:
         """Optimize link formatting."""
         try:
             # Fix link formatting issues
-            markdown_content = re.sub(
-                r"\[([^\]]+)\]\s*\(\s*([^\s\)]+)\s*\)", r"[\1](\2)", markdown_content
-            )
+            markdown_content = _LINK_SPACING_RE.sub(r"[\1](\2)", markdown_content)
 
             # Ensure links don't break across lines improperly
-            markdown_content = re.sub(
-                r"\[([^\]]+)\]\s*\n\s*\(([^\)]+)\)", r"[\1](\2)", markdown_content
-            )
+            markdown_content = _LINK_LINEBREAK_RE.sub(r"[\1](\2)", markdown_content)
 
             return markdown_content
         except Exception as e:
@@ -444,46 +705,58 @@ class MarkdownConverter:
         """Enhance code block formatting with language detection."""
         try:
             # Detect common code patterns and add language hints
-            code_patterns = {
-                r"(?m)^(\s*)```\s*\n((?:(?!```).)*?def\s+\w+(?:(?!```).)*?)^\1```": r"\1```python\n\2\1```",
-                r"(?m)^(\s*)```\s*\n((?:(?!```).)*?function\s+\w+(?:(?!```).)*?)^\1```": r"\1```javascript\n\2\1```",
-                r"(?m)^(\s*)```\s*\n((?:(?!```).)*?class\s+\w+(?:(?!```).)*?)^\1```": r"\1```python\n\2\1```",
-                r"(?m)^(\s*)```\s*\n((?:(?!```).)*?import\s+(?:(?!```).)*?)^\1```": r"\1```python\n\2\1```",
-                r"(?m)^(\s*)```\s*\n((?:(?!```).)*?<\?php(?:(?!```).)*?)^\1```": r"\1```php\n\2\1```",
-                r"(?m)^(\s*)```\s*\n((?:(?!```).)*?<html(?:(?!```).)*?)^\1```": r"\1```html\n\2\1```",
-                r"(?m)^(\s*)```\s*\n((?:(?!```).)*?SELECT\s+(?:(?!```).)*?)^\1```": r"\1```sql\n\2\1```",
-            }
-
-            for pattern, replacement in code_patterns.items():
-                markdown_content = re.sub(
-                    pattern,
-                    replacement,
-                    markdown_content,
-                    flags=re.DOTALL | re.IGNORECASE,
-                )
+            if "```" in markdown_content:
+                markdown_content = self._add_code_languages(markdown_content)
 
             # Ensure code blocks are properly separated
-            markdown_content = re.sub(
-                r"(```[a-z]*\n.*?\n```)", r"\n\1\n", markdown_content, flags=re.DOTALL
-            )
+            markdown_content = _CODE_BLOCK_SPACING_RE.sub(r"\n\1\n", markdown_content)
 
             return markdown_content
         except Exception as e:
             logger.warning(f"Error formatting code blocks: {str(e)}")
             return markdown_content
 
+    @staticmethod
+    def _detect_code_language(code: str) -> Optional[str]:
+        """Return the language hint for a code block body, if one is recognised."""
+        lowered = code.lower()
+        for needle, pattern, language in _CODE_LANGUAGE_SIGNATURES:
+            if needle in lowered and (pattern is None or pattern.search(code)):
+                return language
+        return None
+
+    def _add_code_languages(self, markdown_content: str) -> str:
+        """Tag bare fenced code blocks with a detected language in one scan."""
+        parts = []
+        last_end = 0
+        pos = 0
+        while True:
+            match = _BARE_CODE_BLOCK_RE.search(markdown_content, pos)
+            if match is None:
+                break
+            language = self._detect_code_language(match.group(2))
+            if language is None:
+                # Not a block we can tag; the closing fence may open the next one
+                pos = match.start() + 1
+                continue
+            indent, code = match.group(1), match.group(2)
+            parts.append(markdown_content[last_end : match.start()])
+            parts.append(f"{indent}```{language}\n{code}{indent}```")
+            last_end = pos = match.end()
+
+        if not parts:
+            return markdown_content
+        parts.append(markdown_content[last_end:])
+        return "".join(parts)
+
     def _format_quotes(self, markdown_content: str) -> str:
         """Improve blockquote formatting."""
         try:
             # Ensure blockquotes are properly formatted
-            markdown_content = re.sub(
-                r"^(\s*)>\s*(.+)$", r"\1> \2", markdown_content, flags=re.MULTILINE
-            )
+            markdown_content = _QUOTE_MARKER_RE.sub(r"\1> \2", markdown_content)
 
             # Add spacing around blockquotes
-            markdown_content = re.sub(
-                r"(^>.+$)", r"\n\1\n", markdown_content, flags=re.MULTILINE
-            )
+            markdown_content = _QUOTE_SPACING_RE.sub(r"\n\1\n", markdown_content)
 
             return markdown_content
         except Exception as e:
@@ -625,17 +898,23 @@ class MarkdownConverter:
             formatted_lines = []
 
             for line in lines:
-                # Ensure consistent list marker spacing
-                line = re.sub(r"^(\s*)([-\*\+])\s*(.+)$", r"\1- \3", line)
-
-                # Ensure consistent numbered list formatting
-                line = re.sub(r"^(\s*)(\d+)[\.\)]\s*(.+)$", r"\1\2. \3", line)
+                # The first non-blank character decides which (if any) list
+                # pattern can match, so at most one regex runs per line
+                stripped = line.lstrip()
+                if stripped:
+                    marker = stripped[0]
+                    if marker in "-*+":
+                        # Ensure consistent list marker spacing
+                        line = _BULLET_ITEM_RE.sub(r"\1- \3", line)
+                    elif marker.isdigit():
+                        # Ensure consistent numbered list formatting
+                        line = _NUMBERED_ITEM_RE.sub(r"\1\2. \3", line)
 
                 formatted_lines.append(line)
 
             # Clean up empty list items
             markdown_content = "\n".join(formatted_lines)
-            markdown_content = re.sub(r"\n[-*+]\s*\n(?=\n)", "\n", markdown_content)
+            markdown_content = _EMPTY_LIST_ITEM_RE.sub("\n", markdown_content)
 
             return markdown_content
         except Exception as e:
@@ -649,7 +928,7 @@ class MarkdownConverter:
             formatted_lines = []
 
             for i, line in enumerate(lines):
-                if re.match(r"^#{1,6}\s", line):
+                if _HEADING_RE.match(line):
                     # Ensure proper heading spacing
                     heading = line.strip()
 
@@ -657,7 +936,7 @@ class MarkdownConverter:
                     if (
                         i > 0
                         and lines[i - 1].strip() != ""
-                        and not re.match(r"^#{1,6}\s", lines[i - 1])
+                        and not _HEADING_RE.match(lines[i - 1])
                     ):
                         formatted_lines.append("")
 
@@ -678,19 +957,21 @@ class MarkdownConverter:
         """Apply typography improvements."""
         try:
             # Convert double hyphens to em dashes
-            markdown_content = re.sub(r"(?<!\-)\-\-(?!\-)", "—", markdown_content)
+            if "--" in markdown_content:
+                if "---" in markdown_content:
+                    # Longer hyphen runs (rules, table separators) must be kept
+                    markdown_content = _DOUBLE_HYPHEN_RE.sub("—", markdown_content)
+                else:
+                    markdown_content = markdown_content.replace("--", "—")
 
-            # Fix multiple spaces
-            lines = markdown_content.split("\n")
-            fixed_lines = []
-            for line in lines:
-                line = re.sub(r" {2,}", " ", line)
-                fixed_lines.append(line)
-            markdown_content = "\n".join(fixed_lines)
+            # Fix multiple spaces (the pattern never spans a newline, so the
+            # whole document can be handled in one call)
+            if "  " in markdown_content:
+                markdown_content = _MULTI_SPACE_RE.sub(" ", markdown_content)
 
             # Fix spacing around punctuation
-            markdown_content = re.sub(r"\s+([.!?:;,])", r"\1", markdown_content)
-            markdown_content = re.sub(r"([.!?])\s*([A-Z])", r"\1 \2", markdown_content)
+            markdown_content = _SPACE_BEFORE_PUNCT_RE.sub("", markdown_content)
+            markdown_content = _SENTENCE_SPACING_RE.sub(r"\1 ", markdown_content)
 
             return markdown_content
         except Exception as e:
@@ -700,21 +981,22 @@ class MarkdownConverter:
     def _basic_cleanup(self, markdown_content: str) -> str:
         """Apply basic cleanup operations."""
         try:
-            # Clean up excessive spaces
+            # Strip trailing whitespace and collapse runs of blank lines to a
+            # single blank line in one pass over the lines
             lines = []
+            previous_blank = False
             for line in markdown_content.split("\n"):
-                cleaned_line = line.rstrip()
-                lines.append(cleaned_line)
-
-            markdown_content = "\n".join(lines)
-
-            # Remove excessive blank lines
-            markdown_content = re.sub(r"\n{3,}", "\n\n", markdown_content)
+                line = line.rstrip()
+                if not line:
+                    if previous_blank:
+                        continue
+                    previous_blank = True
+                else:
+                    previous_blank = False
+                lines.append(line)
 
             # Remove leading/trailing whitespace
-            markdown_content = markdown_content.strip()
-
-            return markdown_content
+            return "\n".join(lines).strip()
 
         except Exception as e:
             logger.warning(f"Error in basic cleanup: {str(e)}")
@@ -731,47 +1013,60 @@ class MarkdownConverter:
             HTML content with main content area only
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            cache_key = _html_digest(html_content)
+            cached = self._cache_get(self._content_area_cache, cache_key)
+            if cached is not None:
+                return cached
 
-            # Try to find main content area using common selectors
-            content_selectors = [
-                "main",
-                '[role="main"]',
-                "article",
-                ".content",
-                ".post",
-                ".entry",
-                ".article",
-                "#content",
-                "#main",
-                ".main-content",
-                ".post-content",
-                ".entry-content",
-                ".article-content",
-            ]
-
-            main_content = None
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    for element in elements:
-                        text_length = len(element.get_text(strip=True))
-                        if text_length > 10:
-                            main_content = element
-                            break
-                    if main_content:
-                        break
+            soup = BeautifulSoup(html_content, _HTML_PARSER)
 
-            # If no main content area found, use the body
-            if not main_content:
-                main_content = soup.find("body") or soup
+            main_content = self._find_content_area(soup)
 
-            return str(main_content)
+            content_html = str(main_content)
+            self._cache_set(self._content_area_cache, cache_key, content_html)
+            return content_html
 
         except Exception as e:
             logger.warning(f"Error extracting content area: {str(e)}")
             return html_content
 
+    def _find_content_area(self, soup: BeautifulSoup) -> Any:
+        """Return the element holding the main content of a parsed page."""
+        # Try to find main content area using common selectors
+        content_selectors = [
+            "main",
+            '[role="main"]',
+            "article",
+            ".content",
+            ".post",
+            ".entry",
+            ".article",
+            "#content",
+            "#main",
+            ".main-content",
+            ".post-content",
+            ".entry-content",
+            ".article-content",
+        ]
+
+        main_content = None
+        for selector in content_selectors:
+            elements = soup.select(selector)
+            if elements:
+                for element in elements:
+                    text_length = len(element.get_text(strip=True))
+                    if text_length > 10:
+                        main_content = element
+                        break
+                if main_content:
+                    break
+
+        # If no main content area found, use the body
+        if not main_content:
+            main_content = soup.find("body") or soup
+
+        return main_content
+
     def convert_pdf_to_markdown(
         self,
         pdf_source: Union[str, Path],
@@ -880,6 +1175,7 @@ class MarkdownConverter:
         *,
         embed_images: bool = False,
         embed_options: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Convert a scraped webpage result to Markdown format.
@@ -890,6 +1186,7 @@ class MarkdownConverter:
             include_metadata: Whether to include page metadata
             custom_options: Custom options (maintained for compatibility)
             formatting_options: Advanced formatting options
+            use_cache: Reuse results from the converter's cache_dir, if configured
 
         Returns:
             Dictionary with Markdown content and metadata
@@ -921,21 +1218,43 @@ class MarkdownConverter:
                     "url": url,
                 }
 
-            # Extract main content area if requested
-            if extract_main_content:
-                html_content = self.extract_content_area(html_content)
+            cache_path = None
+            if use_cache and self.cache_dir is not None:
+                cache_path = self._webpage_cache_path(
+                    scrape_result,
+                    html_content,
+                    extract_main_content,
+                    include_metadata,
+                    custom_options,
+                    formatting_options,
+                    embed_images,
+                    embed_options,
+                )
+                cached_result = self._read_webpage_cache(cache_path)
+                if cached_result is not None:
+                    return cached_result
 
             # Update formatting options temporarily if provided
+            # (skipped when they are already in effect, e.g. applied by a batch)
             original_formatting_options = None
-            if formatting_options:
+            if (
+                formatting_options
+                and not formatting_options.items() <= self.formatting_options.items()
+            ):
                 original_formatting_options = self.formatting_options.copy()
                 self.formatting_options.update(formatting_options)
 
             try:
-                # Convert to Markdown
-                markdown_content = self.html_to_markdown(
-                    html_content, url, custom_options
-                )
+                # Convert to Markdown, extracting the main content area first
+                # if requested (parsing the page only once)
+                if extract_main_content:
+                    markdown_content = self._main_content_to_markdown(
+                        html_content, url, custom_options
+                    )
+                else:
+                    markdown_content = self.html_to_markdown(
+                        html_content, url, custom_options
+                    )
             finally:
                 # Restore original formatting options
                 if original_formatting_options:
@@ -989,6 +1308,9 @@ class MarkdownConverter:
 
                 result["metadata"] = metadata
 
+            if cache_path is not None:
+                self._write_webpage_cache(cache_path, result)
+
             return result
 
         except Exception as e:
@@ -999,6 +1321,53 @@ class MarkdownConverter:
                 "url": scrape_result.get("url", ""),
             }
 
+    def _webpage_cache_path(
+        self,
+        scrape_result: Dict[str, Any],
+        html_content: str,
+        *conversion_settings: Any,
+    ) -> Path:
+        """Return the cache file for a page, its validators and conversion settings."""
+        key_data = json.dumps(
+            [
+                scrape_result.get("url", ""),
+                scrape_result.get("etag"),
+                scrape_result.get("last_modified"),
+                _html_digest(html_content).hex(),
+                self.formatting_options,
+                *conversion_settings,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.blake2b(key_data.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _read_webpage_cache(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached webpage conversion, ignoring missing or corrupt entries."""
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable Markdown cache entry: {str(e)}")
+            return None
+
+    def _write_webpage_cache(self, cache_path: Path, result: Dict[str, Any]) -> None:
+        """Store a webpage conversion, replacing the file atomically."""
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Error writing Markdown cache entry: {str(e)}")
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
     def _build_html_from_text(
         self, text_content: str, title: str, content_data: Dict
     ) -> str:
@@ -1013,10 +1382,11 @@ class MarkdownConverter:
             html_parts.append("<div class='main-content'>")
 
             # Split text into paragraphs
-            paragraphs = [p.strip() for p in text_content.split("\n\n") if p.strip()]
-            for paragraph in paragraphs:
-                if paragraph:
-                    html_parts.append(f"<p>{paragraph}</p>")
+            html_parts.extend(
+                f"<p>{paragraph}</p>"
+                for paragraph in map(str.strip, text_content.split("\n\n"))
+                if paragraph
+            )
 
             html_parts.append("</div>")
 
@@ -1024,20 +1394,21 @@ class MarkdownConverter:
             links = content_data.get("links", [])
             if links:
                 html_parts.append("<div class='links'>")
-                for link in links[:50]:
-                    link_url = link.get("url", "")
-                    link_text = link.get("text", link_url)
-                    html_parts.append(f"<a href='{link_url}'>{link_text}</a><br>")
+                html_parts.extend(
+                    f"<a href='{link.get('url', '')}'>"
+                    f"{link.get('text', link.get('url', ''))}</a><br>"
+                    for link in links[:50]
+                )
                 html_parts.append("</div>")
 
             # Add images if available
             images = content_data.get("images", [])
             if images:
                 html_parts.append("<div class='images'>")
-                for img in images[:20]:
-                    img_src = img.get("src", "")
-                    img_alt = img.get("alt", "")
-                    html_parts.append(f"<img src='{img_src}' alt='{img_alt}'>")
+                html_parts.extend(
+                    f"<img src='{img.get('src', '')}' alt='{img.get('alt', '')}'>"
+                    for img in images[:20]
+                )
                 html_parts.append("</div>")
 
             html_parts.append("</body></html>")
@@ -1057,6 +1428,7 @@ class MarkdownConverter:
         *,
         embed_images: bool = False,
         embed_options: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Convert multiple scraped webpage results to Markdown format.
@@ -1067,6 +1439,7 @@ class MarkdownConverter:
             include_metadata: Whether to include page metadata
             custom_options: Custom options (maintained for compatibility)
             formatting_options: Advanced formatting options
+            use_cache: Reuse results from the converter's cache_dir, if configured
 
         Returns:
             Dictionary with converted results and summary
@@ -1074,35 +1447,53 @@ class MarkdownConverter:
         try:
             converted_results = []
             successful_conversions = 0
-            failed_conversions = 0
 
-            for scrape_result in scrape_results:
-                conversion_result = self.convert_webpage_to_markdown(
-                    scrape_result,
-                    extract_main_content,
-                    include_metadata,
-                    custom_options,
-                    formatting_options,
-                    embed_images=embed_images,
-                    embed_options=embed_options,
+            conversion_args = (
+                extract_main_content,
+                include_metadata,
+                custom_options,
+                formatting_options,
+            )
+            conversion_kwargs = {
+                "embed_images": embed_images,
+                "embed_options": embed_options,
+                "use_cache": use_cache,
+            }
+
+            # Apply the batch's formatting options once for every page rather
+            # than copying and restoring them around each conversion
+            original_formatting_options = None
+            if formatting_options:
+                original_formatting_options = self.formatting_options.copy()
+                self.formatting_options.update(formatting_options)
+
+            try:
+                conversions = (
+                    self.convert_webpage_to_markdown(
+                        scrape_result, *conversion_args, **conversion_kwargs
+                    )
+                    for scrape_result in scrape_results
                 )
 
-                if conversion_result.get("success"):
-                    successful_conversions += 1
-                else:
-                    failed_conversions += 1
+                for conversion_result in conversions:
+                    # Tally successes while converting so the summary needs no
+                    # second pass over the results
+                    successful_conversions += bool(conversion_result.get("success"))
+                    converted_results.append(conversion_result)
+            finally:
+                if original_formatting_options is not None:
+                    self.formatting_options = original_formatting_options
 
-                converted_results.append(conversion_result)
+            total_conversions = len(converted_results)
 
             return {
                 "success": True,
                 "results": converted_results,
                 "summary": {
-                    "total": len(scrape_results),
+                    "total": total_conversions,
                     "successful": successful_conversions,
-                    "failed": failed_conversions,
-                    "success_rate": successful_conversions
-                    / max(1, len(scrape_results)),
+                    "failed": total_conversions - successful_conversions,
+                    "success_rate": successful_conversions / max(1, total_conversions),
                 },
                 "conversion_options": {
                     "extract_main_content": extract_main_content,
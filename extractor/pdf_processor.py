@@ -42,7 +42,10 @@ class PDFProcessor:
     """PDF processor for extracting text and converting to Markdown."""
 
     def __init__(
-        self, enable_enhanced_features: bool = True, output_dir: Optional[str] = None
+        self,
+        enable_enhanced_features: bool = True,
+        output_dir: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         """
         Initialize the PDF processor.
@@ -50,10 +53,13 @@ class PDFProcessor:
         Args:
             enable_enhanced_features: Whether to enable enhanced extraction features
             output_dir: Directory to save extracted images and assets
+            session: HTTP session used to download PDFs; owned by the caller.
+                When omitted, a short-lived session is opened per download.
         """
         self.supported_methods = ["pymupdf", "pypdf", "auto"]
         self.temp_dir = tempfile.mkdtemp(prefix="pdf_extractor_")
         self.enable_enhanced_features = enable_enhanced_features
+        self.session = session
 
         # Initialize enhanced processor for images, tables, and formulas
         if self.enable_enhanced_features:
@@ -304,25 +310,33 @@ class PDFProcessor:
     async def _download_pdf(self, url: str) -> Optional[Path]:
         """Download PDF from URL to temporary file."""
         try:
+            if self.session is not None:
+                return await self._fetch_pdf(self.session, url)
             async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        # Create temporary file
-                        temp_file = tempfile.NamedTemporaryFile(
-                            suffix=".pdf", dir=self.temp_dir, delete=False
-                        )
-
-                        # Write PDF content
-                        content = await response.read()
-                        temp_file.write(content)
-                        temp_file.close()
-
-                        return Path(temp_file.name)
-            return None
+                return await self._fetch_pdf(session, url)
         except Exception as e:
             logger.error(f"Error downloading PDF from {url}: {str(e)}")
             return None
 
+    async def _fetch_pdf(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> Optional[Path]:
+        """Fetch a PDF with the given session and store it in the temp directory."""
+        async with session.get(url) as response:
+            if response.status == 200:
+                # Create temporary file
+                temp_file = tempfile.NamedTemporaryFile(
+                    suffix=".pdf", dir=self.temp_dir, delete=False
+                )
+
+                # Write PDF content
+                content = await response.read()
+                temp_file.write(content)
+                temp_file.close()
+
+                return Path(temp_file.name)
+        return None
+
     async def _auto_extract(
         self,
         pdf_path: Path,
@@ -10,6 +10,7 @@ from scrapy.utils.log import configure_logging
 from scrapy.http import Response
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.common.by import By
@@ -325,6 +326,14 @@ class SimpleScraper:
         else:
             self.session.headers.update({"User-Agent": settings.default_user_agent})
 
+        # Keep enough pooled keep-alive connections for concurrent scrapes
+        adapter = HTTPAdapter(
+            pool_connections=settings.concurrent_requests,
+            pool_maxsize=settings.concurrent_requests,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         if settings.use_proxy and settings.proxy_url:
             self.session.proxies.update(
                 {"http": settings.proxy_url, "https": settings.proxy_url}
@@ -494,11 +503,23 @@ class WebScraper:
         urls: List[str],
         method: str = "auto",
         extract_config: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Scrape multiple URLs concurrently."""
-        tasks = [self.scrape_url(url, method, extract_config) for url in urls]
+        """
+        Scrape multiple URLs concurrently.
+
+        At most ``max_concurrency`` URLs are scraped at the same time, defaulting
+        to ``settings.concurrent_requests``.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or settings.concurrent_requests)
+
+        async def scrape(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.scrape_url(url, method, extract_config)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(scrape(url) for url in urls), return_exceptions=True
+        )
 
         processed_results = []
         for i, result in enumerate(results):
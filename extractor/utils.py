@@ -4,16 +4,35 @@ import asyncio
 import hashlib
 import json
 import logging
+import random
 import time
 from typing import Dict, Any, List, Optional, Callable
 from urllib.parse import urlparse
 import re
+from collections import Counter, OrderedDict
 from functools import wraps
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Absolute http(s) URL with a non-empty host and no whitespace
+_HTTP_URL_RE = re.compile(r"https?://[^\s/?#]+\S*", re.IGNORECASE)
+
+# C0/C1 control characters stripped from extracted text
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f-\x9f]")
+
+# Email addresses picked out of extracted text
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
+# Basic phone number patterns, matched in order
+_PHONE_RES = (
+    re.compile(r"\b\d{3}-\d{3}-\d{4}\b"),  # 123-456-7890
+    re.compile(r"\b\(\d{3}\)\s*\d{3}-\d{4}\b"),  # (123) 456-7890
+    re.compile(r"\b\d{3}\.\d{3}\.\d{4}\b"),  # 123.456.7890
+    re.compile(r"\b\d{10}\b"),  # 1234567890
+)
+
 
 @dataclass
 class ScrapingResult:
@@ -46,25 +65,38 @@ class RateLimiter:
 
     async def wait(self) -> None:
         """Wait if necessary to respect rate limit."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        current_time = time.monotonic()
+        next_slot = max(current_time, self.last_request_time + self.min_interval)
 
-        if time_since_last < self.min_interval:
-            sleep_time = self.min_interval - time_since_last
-            await asyncio.sleep(sleep_time)
+        # Claim the slot before sleeping so concurrent callers queue behind it
+        self.last_request_time = next_slot
 
-        self.last_request_time = time.time()
+        if next_slot > current_time:
+            await asyncio.sleep(next_slot - current_time)
 
 
 class RetryManager:
-    """Handle retry logic with exponential backoff."""
+    """Handle retry logic with jittered exponential backoff."""
 
     def __init__(
-        self, max_retries: int = 3, base_delay: float = 1.0, backoff_factor: float = 2.0
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        backoff_factor: float = 2.0,
+        jitter: float = 0.25,
     ):
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.backoff_factor = backoff_factor
+        self.jitter = jitter
+
+    def _calculate_delay(self, attempt: int, rng: Any = random) -> float:
+        """Backoff delay before retry ``attempt``, spread by +/- ``jitter``.
+
+        Jitter keeps clients that failed together from retrying in lockstep.
+        """
+        delay = self.base_delay * (self.backoff_factor**attempt)
+        return delay * (1 + rng.uniform(-self.jitter, self.jitter))
 
     async def retry_async(
         self, func: Callable[..., Any], *args: Any, **kwargs: Any
@@ -81,7 +113,7 @@ class RetryManager:
                 if attempt == self.max_retries:
                     break
 
-                delay = self.base_delay * (self.backoff_factor**attempt)
+                delay = self._calculate_delay(attempt)
                 logger.warning(
                     f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {delay:.2f}s..."
                 )
@@ -143,12 +175,8 @@ class URLValidator:
 
     @staticmethod
     def is_valid_url(url: str) -> bool:
-        """Check if URL is valid."""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+        """Check if URL is a valid http(s) URL."""
+        return isinstance(url, str) and _HTTP_URL_RE.fullmatch(url) is not None
 
     @staticmethod
     def normalize_url(url: str) -> str:
@@ -179,35 +207,25 @@ class TextCleaner:
         if not text:
             return ""
 
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text)
+        # Collapse whitespace runs; str.split() without arguments splits on the
+        # same characters as \s and drops leading/trailing whitespace
+        text = " ".join(text.split())
         # Remove control characters
-        text = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", text)
-        # Strip leading/trailing whitespace
-        text = text.strip()
-
-        return text
+        text = _CONTROL_CHARS_RE.sub("", text)
+        # Strip whitespace left at the ends by removed control characters
+        return text.strip()
 
     @staticmethod
     def extract_emails(text: str) -> List[str]:
         """Extract email addresses from text."""
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        return re.findall(email_pattern, text)
+        return _EMAIL_RE.findall(text)
 
     @staticmethod
     def extract_phone_numbers(text: str) -> List[str]:
         """Extract phone numbers from text."""
-        # Basic phone number patterns
-        phone_patterns = [
-            r"\b\d{3}-\d{3}-\d{4}\b",  # 123-456-7890
-            r"\b\(\d{3}\)\s*\d{3}-\d{4}\b",  # (123) 456-7890
-            r"\b\d{3}\.\d{3}\.\d{4}\b",  # 123.456.7890
-            r"\b\d{10}\b",  # 1234567890
-        ]
-
         phone_numbers = []
-        for pattern in phone_patterns:
-            phone_numbers.extend(re.findall(pattern, text))
+        for pattern in _PHONE_RES:
+            phone_numbers.extend(pattern.findall(text))
 
         return phone_numbers
 
@@ -253,12 +271,12 @@ class ConfigValidator:
 
 
 class CacheManager:
-    """Simple in-memory cache for scraping results."""
+    """Simple in-memory LRU cache for scraping results."""
 
     def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600):
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
         self.timestamps: Dict[str, datetime] = {}
 
     def _generate_key(
@@ -268,7 +286,7 @@ class CacheManager:
         key_data = (
             f"{url}:{method}:{json.dumps(config, sort_keys=True) if config else ''}"
         )
-        return hashlib.md5(key_data.encode(), usedforsecurity=False).hexdigest()
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
     def get(
         self, url: str, method: str, config: Optional[Dict] = None
@@ -286,7 +304,8 @@ class CacheManager:
                 self._remove(key)
                 return None
 
-        return self.cache.get(key)
+        self.cache.move_to_end(key)
+        return self.cache[key]
 
     def set(
         self,
@@ -299,7 +318,9 @@ class CacheManager:
         key = self._generate_key(url, method, config)
 
         # Ensure cache size limit
-        if len(self.cache) >= self.max_size:
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
             self._evict_oldest()
 
         self.cache[key] = result.copy()
@@ -311,12 +332,12 @@ class CacheManager:
         self.timestamps.pop(key, None)
 
     def _evict_oldest(self) -> None:
-        """Evict oldest cache entry."""
-        if not self.timestamps:
+        """Evict least recently used cache entry."""
+        if not self.cache:
             return
 
-        oldest_key = min(self.timestamps.keys(), key=lambda k: self.timestamps[k])
-        self._remove(oldest_key)
+        oldest_key, _ = self.cache.popitem(last=False)
+        self.timestamps.pop(oldest_key, None)
 
     def clear(self) -> None:
         """Clear all cache."""
@@ -342,17 +363,23 @@ class ErrorHandler:
         error_type = type(e).__name__
         error_message = str(e)
 
+        # Lazy %-style arguments: the message is only built if ERROR is enabled
         logger.error(
-            f"Scraping error for {url} using {method}: {error_type}: {error_message}"
+            "Scraping error for %s using %s: %s: %s",
+            url,
+            method,
+            error_type,
+            error_message,
         )
 
         # Categorize common errors
-        if "timeout" in error_message.lower():
+        lowered = error_message.lower()
+        if "timeout" in lowered:
             category = "timeout"
             user_message = (
                 "Request timed out. The website might be slow or unavailable."
             )
-        elif "connection" in error_message.lower():
+        elif "connection" in lowered:
             category = "connection"
             user_message = (
                 "Connection failed. Please check the URL and your internet connection."
@@ -365,7 +392,7 @@ class ErrorHandler:
             user_message = (
                 "Access forbidden (403). The website might be blocking scraping."
             )
-        elif "cloudflare" in error_message.lower():
+        elif "cloudflare" in lowered:
             category = "anti_bot"
             user_message = "Anti-bot protection detected. Try using stealth mode or a different method."
         else:
@@ -395,8 +422,8 @@ class MetricsCollector:
             "successful_requests": 0,
             "failed_requests": 0,
             "total_duration_ms": 0,
-            "methods_used": {},
-            "error_categories": {},
+            "methods_used": Counter(),
+            "error_categories": Counter(),
             "domains_scraped": set(),
         }
 
@@ -417,14 +444,10 @@ class MetricsCollector:
         else:
             self.metrics["failed_requests"] += 1
             if error_category:
-                self.metrics["error_categories"][error_category] = (
-                    self.metrics["error_categories"].get(error_category, 0) + 1
-                )
+                self.metrics["error_categories"][error_category] += 1
 
         # Track method usage
-        self.metrics["methods_used"][method] = (
-            self.metrics["methods_used"].get(method, 0) + 1
-        )
+        self.metrics["methods_used"][method] += 1
 
         # Track domains
         domain = URLValidator.extract_domain(url)
@@ -433,6 +456,8 @@ class MetricsCollector:
     def get_stats(self) -> Dict[str, Any]:
         """Get current metrics."""
         stats = self.metrics.copy()
+        stats["methods_used"] = dict(stats["methods_used"])
+        stats["error_categories"] = dict(stats["error_categories"])
         stats["domains_scraped"] = list(stats["domains_scraped"])
         stats["success_rate"] = self.metrics["successful_requests"] / max(
             1, self.metrics["total_requests"]
@@ -449,8 +474,8 @@ class MetricsCollector:
             "successful_requests": 0,
             "failed_requests": 0,
             "total_duration_ms": 0,
-            "methods_used": {},
-            "error_categories": {},
+            "methods_used": Counter(),
+            "error_categories": Counter(),
             "domains_scraped": set(),
         }
 
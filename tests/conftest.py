@@ -1,21 +1,49 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
-import asyncio
 import tempfile
 from unittest.mock import Mock, AsyncMock
 
+from bs4 import BeautifulSoup
+
 from extractor.config import DataExtractorSettings
 from extractor.scraper import WebScraper
 from extractor.advanced_features import AntiDetectionScraper, FormHandler
+from extractor.pdf_processor import PDFProcessor, _import_fitz, _import_pypdf
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pdf_imports():
+    """Import the lazily loaded PDF libraries once, before any test runs."""
+    for import_library in (_import_fitz, _import_pypdf):
+        try:
+            import_library()
+        except ImportError:
+            pass
+
+
+@pytest.fixture(scope="module")
+def pdf_processor():
+    """PDFProcessor shared by the tests of a module, cleaned up once."""
+    processor = PDFProcessor()
+    yield processor
+    processor.cleanup()
+
+
+@pytest.fixture
+def fresh_processor():
+    """Per-test PDFProcessor for tests that tear down its temp directory."""
+    processor = PDFProcessor()
+    yield processor
+    processor.cleanup()
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def tmp_pdf_path(tmp_path_factory):
+    """A placeholder .pdf file shared by tests whose extractors are mocked."""
+    path = tmp_path_factory.mktemp("pdfs") / "fake.pdf"
+    path.write_bytes(b"%PDF-1.4\n")
+    return path
 
 
 @pytest.fixture
@@ -32,6 +60,12 @@ def test_config():
     )
 
 
+@pytest.fixture(scope="session")
+def scraper():
+    """WebScraper shared across the session; tests only patch it in context."""
+    return WebScraper()
+
+
 @pytest.fixture
 def mock_web_scraper():
     """Mock WebScraper for testing."""
@@ -57,7 +91,13 @@ def mock_form_handler():
     return handler
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def html_parser():
+    """BeautifulSoup parser backend used by the HTML parsing tests."""
+    return "lxml"
+
+
+@pytest.fixture(scope="session")
 def sample_html():
     """Sample HTML content for testing."""
     return """
@@ -88,6 +128,12 @@ def sample_html():
     """
 
 
+@pytest.fixture(scope="session")
+def sample_soup(sample_html, html_parser):
+    """sample_html parsed once per session; tests must not mutate it."""
+    return BeautifulSoup(sample_html, html_parser)
+
+
 @pytest.fixture
 def sample_extraction_config():
     """Sample extraction configuration for testing."""
@@ -99,9 +145,9 @@ def sample_extraction_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_scrape_result():
-    """Sample scrape result for testing."""
+    """Sample scrape result shared across the session; tests must not mutate it."""
     return {
         "url": "https://example.com",
         "status_code": 200,
@@ -158,7 +158,6 @@ class TestComprehensiveIntegration:
             "metadata": {"response_time": 1.5, "content_length": 2048},
         }
 
-    @pytest.mark.asyncio
     async def test_full_markdown_conversion_pipeline(
         self, mock_successful_scrape_result
     ):
@@ -232,7 +231,6 @@ class TestComprehensiveIntegration:
             assert metadata["word_count"] > 0
             assert metadata["character_count"] > 0
 
-    @pytest.mark.asyncio
     async def test_batch_conversion_with_mixed_results(self):
         """Test batch conversion with a mix of successful and failed results."""
         tools = await app.get_tools()
@@ -279,7 +277,6 @@ class TestComprehensiveIntegration:
             assert results[1].success is False  # Second should fail
             assert results[2].success is True  # Third should succeed
 
-    @pytest.mark.asyncio
     async def test_error_resilience_and_recovery(self):
         """Test system resilience when various components fail."""
         tools = await app.get_tools()
@@ -311,7 +308,6 @@ class TestComprehensiveIntegration:
             )  # Tool execution failed due to scraping error
             assert result.error is not None  # Error information provided
 
-    @pytest.mark.asyncio
     async def test_performance_under_load(self):
         """Test system performance under simulated load."""
         tools = await app.get_tools()
@@ -359,7 +355,6 @@ class TestComprehensiveIntegration:
                 pages_per_second > 0.5
             )  # Should process at least 0.5 pages per second
 
-    @pytest.mark.asyncio
     async def test_concurrent_requests_handling(self):
         """Test handling of multiple concurrent requests."""
         tools = await app.get_tools()
@@ -401,7 +396,6 @@ class TestComprehensiveIntegration:
                 assert result.success is True
                 assert "# Concurrent" in result.markdown_content
 
-    @pytest.mark.asyncio
     async def test_data_integrity_throughout_pipeline(self):
         """Test that data integrity is maintained throughout the processing pipeline."""
         tools = await app.get_tools()
@@ -464,7 +458,6 @@ class TestComprehensiveIntegration:
             assert "string with 'quotes'" in markdown
             assert 'and "doubles"' in markdown
 
-    @pytest.mark.asyncio
     async def test_edge_cases_and_boundary_conditions(self):
         """Test various edge cases and boundary conditions."""
         tools = await app.get_tools()
@@ -535,7 +528,6 @@ class TestComprehensiveIntegration:
                 else:
                     assert result.error is not None
 
-    @pytest.mark.asyncio
     async def test_configuration_flexibility(self):
         """Test that various configuration combinations work correctly."""
         tools = await app.get_tools()
@@ -601,7 +593,6 @@ class TestComprehensiveIntegration:
 class TestSystemHealthAndMonitoring:
     """Integration tests for system health and monitoring capabilities."""
 
-    @pytest.mark.asyncio
     async def test_metrics_collection_integration(self):
         """Test that metrics are collected properly during operations."""
         tools = await app.get_tools()
@@ -642,7 +633,6 @@ class TestSystemHealthAndMonitoring:
         assert hasattr(metrics_result, "method_usage")
         assert hasattr(metrics_result, "cache_stats")
 
-    @pytest.mark.asyncio
     async def test_cache_integration(self):
         """Test cache functionality integration."""
         tools = await app.get_tools()
@@ -654,7 +644,6 @@ class TestSystemHealthAndMonitoring:
         assert result.success is True
         assert hasattr(result, "message")
 
-    @pytest.mark.asyncio
     async def test_error_logging_and_handling(self):
         """Test that errors are properly logged and handled."""
         tools = await app.get_tools()
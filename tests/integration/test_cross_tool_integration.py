@@ -25,7 +25,6 @@ class TestCrossToolIntegration:
         """Get all MCP tools from the app."""
         return await app.get_tools()
 
-    @pytest.mark.asyncio
     async def test_webpage_to_pdf_to_markdown_workflow(self, all_tools, pdf_processor):
         """Test a complete workflow: scrape webpage, then process any PDFs found."""
         scrape_tool = all_tools["scrape_webpage"]
@@ -147,7 +146,6 @@ class TestCrossToolIntegration:
                 enhanced_options=None,
             )
 
-    @pytest.mark.asyncio
     async def test_batch_scraping_with_pdf_extraction_workflow(
         self, all_tools, pdf_processor
     ):
@@ -264,7 +262,6 @@ class TestCrossToolIntegration:
             assert pdf_response.successful_count == 2
             assert pdf_response.total_word_count == 4000
 
-    @pytest.mark.asyncio
     async def test_metrics_collection_across_multiple_tools(
         self, all_tools, pdf_processor
     ):
@@ -345,7 +342,6 @@ class TestCrossToolIntegration:
             assert hasattr(metrics_response, "cache_stats")
             assert hasattr(metrics_response, "method_usage")
 
-    @pytest.mark.asyncio
     async def test_error_propagation_across_tools(self, all_tools, pdf_processor):
         """Test how errors propagate when using multiple tools together."""
         scrape_tool = all_tools["scrape_webpage"]
@@ -395,7 +391,6 @@ class TestCrossToolIntegration:
                 else pdf_response.error
             )
 
-    @pytest.mark.asyncio
     async def test_resource_cleanup_across_multiple_tools(
         self, all_tools, pdf_processor
     ):
@@ -486,7 +481,6 @@ class TestCrossToolIntegration:
             f"Potential memory leak: {object_growth} new objects"
         )
 
-    @pytest.mark.asyncio
     async def test_concurrent_multi_tool_operations(self, all_tools, pdf_processor):
         """Test concurrent execution of different tools."""
         scrape_tool = all_tools["scrape_webpage"]
@@ -600,7 +594,6 @@ class TestRealWorldIntegrationScenarios:
             "clear_cache": tools["clear_cache"],
         }
 
-    @pytest.mark.asyncio
     async def test_research_paper_collection_scenario(
         self, scenario_tools, pdf_processor
     ):
@@ -732,7 +725,6 @@ class TestRealWorldIntegrationScenarios:
         metrics_response = await metrics_tool.fn()
         assert metrics_response.success is True
 
-    @pytest.mark.asyncio
     async def test_website_documentation_backup_scenario(
         self, scenario_tools, pdf_processor
     ):
@@ -856,7 +848,6 @@ class TestRealWorldIntegrationScenarios:
             assert "Page" in result.markdown_content
         assert "FAQ" in pdf_result.content
 
-    @pytest.mark.asyncio
     async def test_competitive_analysis_scenario(self, scenario_tools, pdf_processor):
         """Test competitive analysis workflow across multiple competitor sites."""
         # Scenario: Analyze multiple competitor websites and their resources
@@ -26,7 +26,6 @@ class TestEndToEndRealWorldScenarios:
         """Get all tools for end-to-end testing."""
         return await app.get_tools()
 
-    @pytest.mark.asyncio
     async def test_complete_document_processing_pipeline(
         self, e2e_tools, pdf_processor
     ):
@@ -605,7 +604,6 @@ Editorial office: +1-555-0123
         print(f"   - HTML pages: ✓ {len(html_results)} additional pages processed")
         print(f"   - Total processing time: {processing_duration:.2f}s")
 
-    @pytest.mark.asyncio
     async def test_error_recovery_and_resilience_scenarios(
         self, e2e_tools, pdf_processor
     ):
@@ -870,7 +868,6 @@ Editorial office: +1-555-0123
         )
         print(f"   - Stress test duration: {stress_duration:.2f}s")
 
-    @pytest.mark.asyncio
     async def test_performance_benchmarking_and_optimization(
         self, e2e_tools, pdf_processor
     ):
@@ -948,11 +945,13 @@ Editorial office: +1-555-0123
                 "pages_processed": 5,
             }
 
+        # Benchmark the processing itself, not the per-request rate limit
         with (
             patch("extractor.server._get_pdf_processor", return_value=pdf_processor),
             patch.object(
                 pdf_processor, "process_pdf", side_effect=mock_concurrent_pdf_process
             ),
+            patch("extractor.server.rate_limiter", spec=True),
         ):
             # Create concurrent tasks
             for i in range(num_concurrent):
@@ -1142,7 +1141,6 @@ Editorial office: +1-555-0123
             f"   - Network efficiency: avg overhead {sum(r['overhead'] for r in network_results) / len(network_results):.3f}s"
         )
 
-    @pytest.mark.asyncio
     async def test_data_consistency_and_validation(self, e2e_tools, pdf_processor):
         """Test data consistency and validation across the entire processing pipeline."""
 
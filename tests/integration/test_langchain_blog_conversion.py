@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
 """Integration test for LangChain blog conversion to verify paragraph formatting."""
 
-import pytest
 import tempfile
 from extractor.scraper import WebScraper
 from extractor.markdown_converter import MarkdownConverter
 
 
-@pytest.mark.asyncio
 async def test_langchain_blog_conversion():
     """Test conversion of the LangChain blog with different methods."""
     url = "https://blog.langchain.com/context-engineering-for-agents/"
@@ -78,7 +78,6 @@ class TestMCPToolsIntegration:
             },
         }
 
-    @pytest.mark.asyncio
     async def test_all_tools_registered(self):
         """Test that all expected MCP tools are registered."""
         tools = await app.get_tools()
@@ -106,7 +105,6 @@ class TestMCPToolsIntegration:
                 f"Tool {expected_tool} not found in registered tools"
             )
 
-    @pytest.mark.asyncio
     async def test_tool_execution_via_get_tool(self, mock_scraper_result):
         """Test tool execution through get_tool method."""
         # Get the tool by name
@@ -122,7 +120,6 @@ class TestMCPToolsIntegration:
         if hasattr(scrape_tool, "fn"):
             assert callable(scrape_tool.fn)
 
-    @pytest.mark.asyncio
     async def test_fastmcp_app_properties(self):
         """Test FastMCP app has expected properties."""
         assert hasattr(app, "get_tools")
@@ -138,7 +135,6 @@ class TestMCPToolsIntegration:
         tools = await app.get_tools()
         assert len(tools) > 0
 
-    @pytest.mark.asyncio
     async def test_tool_registration_completeness(self):
         """Test that all tools are properly registered with correct structure."""
         tools = await app.get_tools()
@@ -153,7 +149,6 @@ class TestMCPToolsIntegration:
             if tool.description:
                 assert len(tool.description) > 0
 
-    @pytest.mark.asyncio
     async def test_server_initialization(self):
         """Test that server components are properly initialized."""
         # Test that global scrapers are initialized
@@ -168,11 +163,6 @@ class TestMCPToolsIntegration:
 class TestWebScraperIntegration:
     """Integration tests for WebScraper class."""
 
-    @pytest.fixture
-    def scraper(self):
-        """WebScraper instance for testing."""
-        return WebScraper()
-
     def test_scraper_initialization(self, scraper):
         """Test WebScraper initializes correctly."""
         assert isinstance(scraper, WebScraper)
@@ -180,7 +170,6 @@ class TestWebScraperIntegration:
         assert hasattr(scraper, "scrapy_wrapper")
         assert hasattr(scraper, "selenium_scraper")
 
-    @pytest.mark.asyncio
     async def test_scraper_basic_functionality(self, scraper):
         """Test basic scraper functionality."""
         # Test that scraper can be called without errors
@@ -204,7 +193,6 @@ class TestAntiDetectionScraperIntegration:
         assert isinstance(anti_scraper, AntiDetectionScraper)
         assert hasattr(anti_scraper, "ua")
 
-    @pytest.mark.asyncio
     async def test_anti_scraper_basic_functionality(self, anti_scraper):
         """Test basic anti-detection scraper functionality."""
         assert hasattr(anti_scraper, "scrape_with_stealth")
@@ -214,7 +202,6 @@ class TestAntiDetectionScraperIntegration:
 class TestMarkdownConversionIntegration:
     """Integration tests for Markdown conversion tools registration."""
 
-    @pytest.mark.asyncio
     async def test_markdown_tools_registration(self):
         """Test that the new Markdown conversion tools are properly registered."""
         tools = await app.get_tools()
@@ -235,7 +222,6 @@ class TestMarkdownConversionIntegration:
         assert "batch" in batch_tool.description.lower()
         assert "Markdown" in batch_tool.description
 
-    @pytest.mark.asyncio
     async def test_markdown_tools_parameters(self):
         """Test that the new tools have correct parameter schemas."""
         tools = await app.get_tools()
@@ -252,7 +238,6 @@ class TestMarkdownConversionIntegration:
 class TestMarkdownConversionToolIntegration:
     """Integration tests for Markdown conversion tool functionality through MCP layer."""
 
-    @pytest.mark.asyncio
     async def test_markdown_conversion_tools_structure(self):
         """Test that Markdown conversion tools have proper structure and can be accessed."""
         tools = await app.get_tools()
@@ -271,7 +256,6 @@ class TestMarkdownConversionToolIntegration:
         if batch_tool.description:
             assert "batch" in batch_tool.description.lower()
 
-    @pytest.mark.asyncio
     async def test_markdown_tools_parameters_embed_images(self):
         """Ensure new embed_images parameters are exposed."""
         tools = await app.get_tools()
@@ -291,7 +275,6 @@ class TestMarkdownConversionToolIntegration:
             assert "embed_images" in params
             assert "embed_options" in params
 
-    @pytest.mark.asyncio
     async def test_markdown_converter_component_integration(self):
         """Test that MarkdownConverter integrates properly with the system."""
         # Test direct MarkdownConverter functionality
@@ -308,7 +291,6 @@ class TestMarkdownConversionToolIntegration:
         assert "# Test" in markdown
         assert "Content" in markdown
 
-    @pytest.mark.asyncio
     async def test_markdown_conversion_with_advanced_formatting(self):
         """Test advanced formatting options integration."""
         converter = MarkdownConverter()
@@ -340,7 +322,6 @@ class TestMarkdownConversionToolIntegration:
         assert "![Test](test.jpg)" in markdown  # Image enhancement
         assert "—" in markdown  # Typography (-- to em dash)
 
-    @pytest.mark.asyncio
     async def test_error_handling_integration(self):
         """Test error handling integration across components."""
         converter = MarkdownConverter()
@@ -361,7 +342,6 @@ class TestMarkdownConversionToolIntegration:
         conversion_result = converter.convert_webpage_to_markdown(empty_result)
         assert conversion_result["success"] is True
 
-    @pytest.mark.asyncio
     async def test_component_configuration_integration(self):
         """Test that configuration options work across the integration stack."""
         converter = MarkdownConverter()
@@ -388,7 +368,6 @@ class TestMarkdownConversionToolIntegration:
 class TestSystemHealthAndDiagnostics:
     """Integration tests for system health and diagnostic capabilities."""
 
-    @pytest.mark.asyncio
     async def test_all_components_initialized(self):
         """Test that all system components are properly initialized."""
         # Test that server components exist
@@ -407,7 +386,6 @@ class TestSystemHealthAndDiagnostics:
         assert hasattr(app, "get_tool")
         assert app.name is not None
 
-    @pytest.mark.asyncio
     async def test_tool_parameter_schemas_completeness(self):
         """Test that all tools have complete parameter schemas."""
         tools = await app.get_tools()
@@ -435,7 +413,6 @@ class TestSystemHealthAndDiagnostics:
                 # This is acceptable as long as the tool has other validation
                 pass
 
-    @pytest.mark.asyncio
     async def test_system_resilience_under_load(self):
         """Test system resilience when processing multiple requests."""
         # Test accessing multiple tools simultaneously
@@ -455,7 +432,6 @@ class TestSystemHealthAndDiagnostics:
             assert result is not None
             assert hasattr(result, "name")
 
-    @pytest.mark.asyncio
     async def test_memory_and_resource_management(self):
         """Test that the system manages memory and resources properly."""
         import gc
@@ -483,7 +459,6 @@ class TestSystemHealthAndDiagnostics:
             f"Memory leak detected: {object_growth} new objects"
         )
 
-    @pytest.mark.asyncio
     async def test_pdf_conversion_tools_registration(self):
         """Test that PDF conversion tools are properly registered."""
         pdf_tools = await app.get_tools()
@@ -498,7 +473,6 @@ class TestSystemHealthAndDiagnostics:
         batch_pdf_tool = pdf_tools["batch_convert_pdfs_to_markdown"]
         assert batch_pdf_tool.name == "batch_convert_pdfs_to_markdown"
 
-    @pytest.mark.asyncio
     async def test_pdf_tool_parameter_validation(self):
         """Test PDF tool parameter validation."""
         # Test that PDF tools are accessible through app
@@ -511,7 +485,6 @@ class TestSystemHealthAndDiagnostics:
         assert pdf_tool.name == "convert_pdf_to_markdown"
         assert "PDF" in pdf_tool.description or "pdf" in pdf_tool.description
 
-    @pytest.mark.asyncio
     async def test_batch_pdf_tool_parameter_validation(self):
         """Test batch PDF tool parameter validation."""
         # Test batch PDF tool registration
@@ -525,7 +498,6 @@ class TestSystemHealthAndDiagnostics:
             or "PDF" in batch_pdf_tool.description
         )
 
-    @pytest.mark.asyncio
     async def test_pdf_tools_error_handling(self):
         """Test PDF tools error handling for nonexistent files."""
         # Verify tools exist and have proper structure
@@ -542,7 +514,6 @@ class TestSystemHealthAndDiagnostics:
             == "batch_convert_pdfs_to_markdown"
         )
 
-    @pytest.mark.asyncio
     async def test_pdf_tool_integration_with_mocks(self):
         """Test PDF tools with mocked PDF processing."""
         # Test that PDF tools can be accessed through app interface
@@ -560,7 +531,6 @@ class TestSystemHealthAndDiagnostics:
         assert "pdf_source" in params
         assert "method" in params
 
-    @pytest.mark.asyncio
     async def test_pdf_tools_resource_cleanup(self):
         """Test that PDF tools properly clean up resources."""
         # Verify that PDF processor has cleanup capabilities
@@ -2,7 +2,6 @@
 
 import pytest
 import pytest_asyncio
-import tempfile
 import os
 from unittest.mock import patch, MagicMock
 
@@ -25,12 +24,6 @@ def sample_pdf_content():
     }
 
 
-@pytest.fixture
-def pdf_processor():
-    """Create a PDF processor instance for testing."""
-    return PDFProcessor()
-
-
 @pytest_asyncio.fixture
 async def pdf_test_tools():
     """Get PDF processing tools from the app."""
@@ -44,7 +37,6 @@ async def pdf_test_tools():
 class TestPDFToolsIntegration:
     """Integration tests for PDF processing tools."""
 
-    @pytest.mark.asyncio
     async def test_pdf_convert_tool_actual_execution(
         self, pdf_test_tools, pdf_processor, sample_pdf_content
     ):
@@ -108,7 +100,6 @@ class TestPDFToolsIntegration:
                     enhanced_options=None,
                 )
 
-    @pytest.mark.asyncio
     async def test_pdf_batch_tool_actual_execution(
         self, pdf_test_tools, pdf_processor, sample_pdf_content
     ):
@@ -190,7 +181,6 @@ class TestPDFToolsIntegration:
                 assert results[1].success is True
                 assert results[2].success is False
 
-    @pytest.mark.asyncio
     async def test_pdf_tools_parameter_validation_integration(self, pdf_test_tools):
         """Test parameter validation through actual tool execution."""
         convert_tool = pdf_test_tools["convert"]
@@ -243,7 +233,6 @@ class TestPDFToolsIntegration:
                 )
                 assert result.success is False
 
-    @pytest.mark.asyncio
     async def test_pdf_tools_with_page_range(
         self, pdf_test_tools, pdf_processor, sample_pdf_content
     ):
@@ -285,7 +274,6 @@ class TestPDFToolsIntegration:
             args, kwargs = mock_process.call_args
             assert kwargs["page_range"] == (1, 3)  # Server converts list to tuple
 
-    @pytest.mark.asyncio
     async def test_pdf_tools_error_handling_integration(
         self, pdf_test_tools, pdf_processor
     ):
@@ -355,7 +343,6 @@ class TestPDFToolsIntegration:
                 else result.error
             )
 
-    @pytest.mark.asyncio
     async def test_pdf_tools_with_different_output_formats(
         self, pdf_test_tools, pdf_processor, sample_pdf_content
     ):
@@ -426,7 +413,6 @@ class TestPDFToolsIntegration:
             assert result.output_format == "markdown"
             assert hasattr(result, "content") and result.content is not None
 
-    @pytest.mark.asyncio
     async def test_pdf_processor_resource_management_integration(self):
         """Test PDF processor resource management in integration context."""
         # Create a new PDF processor instance
@@ -442,7 +428,6 @@ class TestPDFToolsIntegration:
         # Verify temp directory was cleaned up
         assert not os.path.exists(temp_dir_path)
 
-    @pytest.mark.asyncio
     async def test_pdf_tools_concurrent_execution(
         self, pdf_test_tools, pdf_processor, sample_pdf_content
     ):
@@ -495,138 +480,119 @@ class TestPDFToolsIntegration:
 class TestPDFIntegrationWithRealProcessing:
     """Integration tests with more realistic PDF processing scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_pdf_integration_with_temp_files(self, pdf_test_tools):
+    async def test_pdf_integration_with_temp_files(self, pdf_test_tools, tmp_pdf_path):
         """Test PDF processing with actual temporary files."""
         convert_tool = pdf_test_tools["convert"]
 
-        # Create a temporary file to simulate a PDF
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-            temp_file.write(b"Mock PDF content")
-            temp_path = temp_file.name
-
-        try:
-            # Mock the PDF extraction methods to avoid needing real PDF libraries
-            with patch("extractor.pdf_processor._import_fitz") as mock_import_fitz:
-                mock_fitz = MagicMock()
-                mock_import_fitz.return_value = mock_fitz
-                # Mock successful PyMuPDF processing
-                mock_doc = MagicMock()
-                mock_doc.page_count = 1
-                mock_doc.metadata = {"title": "Test Document"}
+        # Use the shared placeholder file to simulate a PDF
+        temp_path = str(tmp_pdf_path)
 
-                mock_page = MagicMock()
-                mock_page.get_text.return_value = "Test content"
-                mock_doc.load_page.return_value = mock_page
+        # Mock the PDF extraction methods to avoid needing real PDF libraries
+        with patch("extractor.pdf_processor._import_fitz") as mock_import_fitz:
+            mock_fitz = MagicMock()
+            mock_import_fitz.return_value = mock_fitz
+            # Mock successful PyMuPDF processing
+            mock_doc = MagicMock()
+            mock_doc.page_count = 1
+            mock_doc.metadata = {"title": "Test Document"}
 
-                mock_fitz.open.return_value = mock_doc
+            mock_page = MagicMock()
+            mock_page.get_text.return_value = "Test content"
+            mock_doc.load_page.return_value = mock_page
 
-                # Execute the tool with a real file path
-                result = await convert_tool.fn(
-                    pdf_source=temp_path,
-                    method="pymupdf",
-                    include_metadata=True,
-                    page_range=None,
-                    output_format="markdown",
-                    extract_images=True,
-                    extract_tables=True,
-                    extract_formulas=True,
-                    embed_images=False,
-                    enhanced_options=None,
-                )
+            mock_fitz.open.return_value = mock_doc
 
-                assert result.success is True
-                assert result.pdf_source == temp_path
-                assert result.method == "pymupdf"
+            # Execute the tool with a real file path
+            result = await convert_tool.fn(
+                pdf_source=temp_path,
+                method="pymupdf",
+                include_metadata=True,
+                page_range=None,
+                output_format="markdown",
+                extract_images=True,
+                extract_tables=True,
+                extract_formulas=True,
+                embed_images=False,
+                enhanced_options=None,
+            )
 
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_path)
+            assert result.success is True
+            assert result.pdf_source == temp_path
+            assert result.method == "pymupdf"
 
-    @pytest.mark.asyncio
-    async def test_pdf_batch_integration_with_file_mix(self, pdf_test_tools):
+    async def test_pdf_batch_integration_with_file_mix(
+        self, pdf_test_tools, tmp_pdf_path
+    ):
         """Test batch PDF processing with mix of existing and non-existing files."""
         batch_tool = pdf_test_tools["batch"]
 
-        # Create one real temp file, use one non-existing file
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-            temp_file.write(b"Mock PDF content")
-            real_path = temp_file.name
+        # Use the shared placeholder file and one non-existing file
+        real_path = str(tmp_pdf_path)
 
         fake_path = "/nonexistent/fake.pdf"
 
-        try:
-            # Create PDF processor instance for mocking
-            test_pdf_processor = PDFProcessor()
-            # Mock the batch processing to handle the mixed scenario
-            with (
-                patch(
-                    "extractor.server._get_pdf_processor",
-                    return_value=test_pdf_processor,
-                ),
-                patch.object(test_pdf_processor, "batch_process_pdfs") as mock_batch,
-            ):
-                mock_batch.return_value = {
-                    "success": True,
-                    "results": [
-                        {
-                            "success": True,
-                            "text": "Content from real file",
-                            "source": real_path,
-                            "pages_processed": 1,
-                            "word_count": 10,
-                        },
-                        {
-                            "success": False,
-                            "error": "PDF file does not exist",
-                            "source": fake_path,
-                        },
-                    ],
-                    "summary": {
-                        "total_pdfs": 2,
-                        "successful": 1,
-                        "failed": 1,
-                        "total_pages_processed": 1,
-                        "total_words_extracted": 10,
-                        "method_used": "auto",
-                        "output_format": "markdown",
+        # Create PDF processor instance for mocking
+        test_pdf_processor = PDFProcessor()
+        # Mock the batch processing to handle the mixed scenario
+        with (
+            patch(
+                "extractor.server._get_pdf_processor",
+                return_value=test_pdf_processor,
+            ),
+            patch.object(test_pdf_processor, "batch_process_pdfs") as mock_batch,
+        ):
+            mock_batch.return_value = {
+                "success": True,
+                "results": [
+                    {
+                        "success": True,
+                        "text": "Content from real file",
+                        "source": real_path,
+                        "pages_processed": 1,
+                        "word_count": 10,
                     },
-                }
-
-                result = await batch_tool.fn(
-                    pdf_sources=[real_path, fake_path],
-                    method="auto",
-                    include_metadata=True,
-                    page_range=None,
-                    output_format="markdown",
-                    extract_images=True,
-                    extract_tables=True,
-                    extract_formulas=True,
-                    embed_images=False,
-                    enhanced_options=None,
-                )
+                    {
+                        "success": False,
+                        "error": "PDF file does not exist",
+                        "source": fake_path,
+                    },
+                ],
+                "summary": {
+                    "total_pdfs": 2,
+                    "successful": 1,
+                    "failed": 1,
+                    "total_pages_processed": 1,
+                    "total_words_extracted": 10,
+                    "method_used": "auto",
+                    "output_format": "markdown",
+                },
+            }
 
-                assert result.success is True
-                assert result.successful_count == 1
-                assert result.failed_count == 1
+            result = await batch_tool.fn(
+                pdf_sources=[real_path, fake_path],
+                method="auto",
+                include_metadata=True,
+                page_range=None,
+                output_format="markdown",
+                extract_images=True,
+                extract_tables=True,
+                extract_formulas=True,
+                embed_images=False,
+                enhanced_options=None,
+            )
 
-                # Verify the real file was processed successfully
-                real_result = next(
-                    r for r in result.results if r.pdf_source == real_path
-                )
-                assert real_result.success is True
+            assert result.success is True
+            assert result.successful_count == 1
+            assert result.failed_count == 1
 
-                # Verify the fake file failed appropriately
-                fake_result = next(
-                    r for r in result.results if r.pdf_source == fake_path
-                )
-                assert fake_result.success is False
+            # Verify the real file was processed successfully
+            real_result = next(r for r in result.results if r.pdf_source == real_path)
+            assert real_result.success is True
 
-        finally:
-            # Clean up
-            os.unlink(real_path)
+            # Verify the fake file failed appropriately
+            fake_result = next(r for r in result.results if r.pdf_source == fake_path)
+            assert fake_result.success is False
 
-    @pytest.mark.asyncio
     async def test_pdf_url_download_integration_scenario(
         self, pdf_test_tools, pdf_processor
     ):
@@ -687,7 +653,6 @@ class TestPDFIntegrationWithRealProcessing:
                 enhanced_options=None,
             )
 
-    @pytest.mark.asyncio
     async def test_pdf_integration_memory_usage_monitoring(
         self, pdf_test_tools, pdf_processor
     ):
@@ -740,7 +705,42 @@ class TestPDFIntegrationWithRealProcessing:
             f"Potential memory leak: {object_growth} new objects"
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "page_range, expected_error",
+        [
+            ([5, 2], "Start page must be less than end page"),
+            ([-1, 3], "Page numbers must be non-negative"),
+            ([0, 0], "Start page must be less than end page"),
+            ([1, 2, 3], "Page range must contain exactly 2 elements: [start, end]"),
+        ],
+    )
+    async def test_pdf_integration_with_invalid_page_range(
+        self, pdf_test_tools, pdf_processor, page_range, expected_error
+    ):
+        """Test that invalid page ranges are rejected before any processing."""
+        convert_tool = pdf_test_tools["convert"]
+
+        with (
+            patch("extractor.server._get_pdf_processor", return_value=pdf_processor),
+            patch.object(pdf_processor, "process_pdf") as mock_process,
+        ):
+            result = await convert_tool.fn(
+                pdf_source="/test/sample.pdf",
+                method="auto",
+                include_metadata=True,
+                page_range=page_range,
+                output_format="markdown",
+                extract_images=True,
+                extract_tables=True,
+                extract_formulas=True,
+                embed_images=False,
+                enhanced_options=None,
+            )
+
+        assert result.success is False
+        assert result.error == expected_error
+        mock_process.assert_not_called()
+
     async def test_pdf_integration_with_invalid_configurations(self, pdf_test_tools):
         """Test PDF processing with various invalid configuration scenarios."""
         convert_tool = pdf_test_tools["convert"]
@@ -771,28 +771,6 @@ class TestPDFIntegrationWithRealProcessing:
                 )
                 assert result.success is False
 
-        # Test invalid page range format - validation happens at execution
-        with patch("extractor.server._get_pdf_processor", return_value=pdf_processor):
-            with patch.object(pdf_processor, "process_pdf") as mock_process:
-                mock_process.return_value = {
-                    "success": False,
-                    "error": "Start page must be less than end page",
-                }
-
-                result = await convert_tool.fn(
-                    pdf_source="/test/sample.pdf",
-                    method="auto",
-                    include_metadata=True,
-                    page_range=[5, 2],  # End before start
-                    output_format="markdown",
-                    extract_images=True,
-                    extract_tables=True,
-                    extract_formulas=True,
-                    embed_images=False,
-                    enhanced_options=None,
-                )
-                assert result.success is False
-
         # Test empty batch list - validation happens at execution
         with patch("extractor.server._get_pdf_processor", return_value=pdf_processor):
             with patch.object(pdf_processor, "batch_process_pdfs") as mock_batch:
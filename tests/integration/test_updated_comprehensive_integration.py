@@ -103,7 +103,6 @@ def example_function():
         """样本PDF内容用于测试"""
         return "PDF文档内容\n\n这是一个测试PDF文档。\n\n包含多段落内容。"
 
-    @pytest.mark.asyncio
     async def test_end_to_end_scrape_to_markdown_workflow(self, sample_html_content):
         """测试从网页爬取到Markdown转换的端到端工作流"""
         scrape_result = {
@@ -148,7 +147,6 @@ def example_function():
             assert scrape_tool is not None
             assert convert_tool is not None
 
-    @pytest.mark.asyncio
     async def test_batch_processing_integration(self):
         """测试批量处理集成"""
         urls = ["https://example1.com", "https://example2.com", "https://example3.com"]
@@ -212,7 +210,6 @@ def example_function():
             assert batch_scrape_tool is not None
             assert batch_convert_tool is not None
 
-    @pytest.mark.asyncio
     async def test_advanced_features_integration(self):
         """测试高级功能集成"""
         # 测试隐身爬取
@@ -264,7 +261,6 @@ def example_function():
             assert form_tool is not None
             assert structured_tool is not None
 
-    @pytest.mark.asyncio
     async def test_pdf_processing_integration(self, sample_pdf_content):
         """测试PDF处理集成"""
         pdf_result = {
@@ -308,7 +304,6 @@ def example_function():
             assert pdf_tool is not None
             assert batch_pdf_tool is not None
 
-    @pytest.mark.asyncio
     async def test_server_management_integration(self):
         """测试服务器管理集成"""
         metrics_result = {
@@ -353,7 +348,6 @@ def example_function():
             assert metrics_tool is not None
             assert cache_tool is not None
 
-    @pytest.mark.asyncio
     async def test_information_extraction_integration(self):
         """测试信息提取工具集成"""
         page_info_result = {
@@ -416,7 +410,6 @@ class TestPerformanceAndLoadIntegration:
     """性能和负载集成测试"""
 
     @pytest.mark.slow
-    @pytest.mark.asyncio
     async def test_concurrent_tool_access_performance(self):
         """测试并发工具访问性能"""
 
@@ -448,7 +441,6 @@ class TestPerformanceAndLoadIntegration:
         assert access_time < 1.0, f"并发工具访问时间 {access_time:.2f}s 过长"
 
     @pytest.mark.slow
-    @pytest.mark.asyncio
     async def test_batch_processing_scalability(self):
         """测试批量处理可扩展性"""
         # 模拟大量URL的批量处理
@@ -482,7 +474,6 @@ class TestPerformanceAndLoadIntegration:
             batch_tool = await app.get_tool("scrape_multiple_webpages")
             assert batch_tool is not None
 
-    @pytest.mark.asyncio
     async def test_memory_usage_integration(self):
         """测试内存使用集成"""
         try:
@@ -514,7 +505,6 @@ class TestPerformanceAndLoadIntegration:
 class TestErrorHandlingAndResilience:
     """错误处理和恢复性集成测试"""
 
-    @pytest.mark.asyncio
     async def test_network_failure_resilience(self):
         """测试网络故障恢复性"""
         with patch("extractor.scraper.WebScraper.scrape_url") as mock_scrape:
@@ -534,7 +524,6 @@ class TestErrorHandlingAndResilience:
             scrape_tool = await app.get_tool("scrape_webpage")
             assert scrape_tool is not None
 
-    @pytest.mark.asyncio
     async def test_invalid_input_handling(self):
         """测试无效输入处理"""
         # 所有工具都应该存在并能处理基本的验证
@@ -552,7 +541,6 @@ class TestErrorHandlingAndResilience:
             tool = tools[tool_name]
             assert tool is not None, f"工具 {tool_name} 为None"
 
-    @pytest.mark.asyncio
     async def test_resource_exhaustion_handling(self):
         """测试资源耗尽处理"""
         # 模拟资源耗尽情况
@@ -563,7 +551,6 @@ class TestErrorHandlingAndResilience:
             pdf_tool = await app.get_tool("convert_pdf_to_markdown")
             assert pdf_tool is not None
 
-    @pytest.mark.asyncio
     async def test_configuration_validation(self):
         """测试配置验证"""
         # 验证关键配置项
@@ -581,7 +568,6 @@ class TestErrorHandlingAndResilience:
 class TestSecurityAndCompliance:
     """安全和合规集成测试"""
 
-    @pytest.mark.asyncio
     async def test_robots_txt_compliance_integration(self):
         """测试robots.txt合规性集成"""
         robots_result = {
@@ -609,7 +595,6 @@ class TestSecurityAndCompliance:
             assert "robots.txt" in result.robots_txt_url
             assert "Disallow: /private/" in result.robots_content
 
-    @pytest.mark.asyncio
     async def test_user_agent_and_rate_limiting(self):
         """测试User-Agent和速率限制"""
         # 验证配置中的User-Agent和速率限制设置
@@ -624,7 +609,6 @@ class TestSecurityAndCompliance:
         assert scrape_tool is not None
         assert stealth_tool is not None
 
-    @pytest.mark.asyncio
     async def test_data_privacy_compliance(self):
         """测试数据隐私合规"""
         # 验证工具不会意外存储敏感信息
@@ -640,7 +624,6 @@ class TestSecurityAndCompliance:
 class TestBackwardCompatibilityAndUpgrade:
     """向后兼容性和升级测试"""
 
-    @pytest.mark.asyncio
     async def test_api_backward_compatibility(self):
         """测试API向后兼容性"""
         # 验证所有预期的工具仍然存在
@@ -655,7 +638,6 @@ class TestBackwardCompatibilityAndUpgrade:
         for tool_name in expected_core_tools:
             assert tool_name in tools, f"核心工具 {tool_name} 缺失，可能破坏向后兼容性"
 
-    @pytest.mark.asyncio
     async def test_configuration_upgrade_compatibility(self):
         """测试配置升级兼容性"""
         # 验证配置系统能够处理新旧配置格式
@@ -668,7 +650,6 @@ class TestBackwardCompatibilityAndUpgrade:
         assert hasattr(settings, "browser_headless")
         assert hasattr(settings, "use_random_user_agent")
 
-    @pytest.mark.asyncio
     async def test_tool_interface_stability(self):
         """测试工具接口稳定性"""
         tools = await app.get_tools()
@@ -14,7 +14,6 @@ from extractor.server import app
 class TestUpdatedMCPToolsIntegration:
     """更新的MCP工具集成测试"""
 
-    @pytest.mark.asyncio
     async def test_all_14_mcp_tools_registered(self):
         """测试所有14个MCP工具都已注册"""
         tools = await app.get_tools()
@@ -48,7 +47,6 @@ class TestUpdatedMCPToolsIntegration:
         # 确保没有额外的未预期工具
         assert len(tool_names) >= 14, f"注册工具数量 {len(tool_names)} 少于预期的14个"
 
-    @pytest.mark.asyncio
     async def test_tool_schema_completeness(self):
         """测试所有工具的schema完整性"""
         tools = await app.get_tools()
@@ -62,7 +60,6 @@ class TestUpdatedMCPToolsIntegration:
             assert tool.name == tool_name, f"工具名称不匹配: {tool.name} != {tool_name}"
             assert tool.description, f"工具 {tool_name} 的描述不能为空"
 
-    @pytest.mark.asyncio
     async def test_basic_scraping_tools_integration(self):
         """测试基本爬取工具集成"""
         with patch("extractor.scraper.WebScraper.scrape_url") as mock_scrape:
@@ -86,7 +83,6 @@ class TestUpdatedMCPToolsIntegration:
             batch_scrape_tool = await app.get_tool("scrape_multiple_webpages")
             assert batch_scrape_tool is not None
 
-    @pytest.mark.asyncio
     async def test_advanced_scraping_tools_integration(self):
         """测试高级爬取工具集成"""
         with patch(
@@ -109,7 +105,6 @@ class TestUpdatedMCPToolsIntegration:
         structured_tool = await app.get_tool("extract_structured_data")
         assert structured_tool is not None
 
-    @pytest.mark.asyncio
     async def test_information_tools_integration(self):
         """测试信息获取工具集成"""
         # 测试页面信息获取
@@ -124,7 +119,6 @@ class TestUpdatedMCPToolsIntegration:
         robots_tool = await app.get_tool("check_robots_txt")
         assert robots_tool is not None
 
-    @pytest.mark.asyncio
     async def test_markdown_conversion_tools_integration(self):
         """测试Markdown转换工具集成"""
         with patch(
@@ -147,7 +141,6 @@ class TestUpdatedMCPToolsIntegration:
             )
             assert batch_convert_tool is not None
 
-    @pytest.mark.asyncio
     async def test_pdf_processing_tools_integration(self):
         """测试PDF处理工具集成"""
         with patch("extractor.pdf_processor.PDFProcessor.process_pdf") as mock_pdf:
@@ -167,7 +160,6 @@ class TestUpdatedMCPToolsIntegration:
             batch_pdf_tool = await app.get_tool("batch_convert_pdfs_to_markdown")
             assert batch_pdf_tool is not None
 
-    @pytest.mark.asyncio
     async def test_server_management_tools_integration(self):
         """测试服务器管理工具集成"""
         # 测试服务器指标获取
@@ -178,7 +170,6 @@ class TestUpdatedMCPToolsIntegration:
         cache_tool = await app.get_tool("clear_cache")
         assert cache_tool is not None
 
-    @pytest.mark.asyncio
     async def test_tool_error_handling(self):
         """测试工具错误处理"""
         from fastmcp.exceptions import NotFoundError
@@ -187,7 +178,6 @@ class TestUpdatedMCPToolsIntegration:
         with pytest.raises(NotFoundError, match="Unknown tool: nonexistent_tool"):
             await app.get_tool("nonexistent_tool")
 
-    @pytest.mark.asyncio
     async def test_app_metadata(self):
         """测试应用元数据"""
         assert hasattr(app, "name")
@@ -199,7 +189,6 @@ class TestUpdatedMCPToolsIntegration:
 class TestMCPToolsParameterValidation:
     """测试MCP工具参数验证"""
 
-    @pytest.mark.asyncio
     async def test_scrape_webpage_parameters(self):
         """测试scrape_webpage工具参数"""
         tool = await app.get_tool("scrape_webpage")
@@ -211,7 +200,6 @@ class TestMCPToolsParameterValidation:
             assert "properties" in schema
             assert "url" in schema["properties"]
 
-    @pytest.mark.asyncio
     async def test_batch_tools_parameters(self):
         """测试批量工具参数"""
         batch_tools = [
@@ -224,7 +212,6 @@ class TestMCPToolsParameterValidation:
             tool = await app.get_tool(tool_name)
             assert tool is not None, f"批量工具 {tool_name} 未找到"
 
-    @pytest.mark.asyncio
     async def test_advanced_tools_parameters(self):
         """测试高级工具参数"""
         advanced_tools = [
@@ -262,7 +249,6 @@ class TestMCPToolsIntegrationWorkflow:
             "meta_description": "Example domain for documentation",
         }
 
-    @pytest.mark.asyncio
     async def test_scrape_to_markdown_workflow(self, sample_scrape_result):
         """测试爬取到Markdown的完整工作流"""
         with (
@@ -286,7 +272,6 @@ class TestMCPToolsIntegrationWorkflow:
             assert scrape_tool is not None
             assert convert_tool is not None
 
-    @pytest.mark.asyncio
     async def test_batch_processing_workflow(self):
         """测试批量处理工作流"""
         with (
@@ -329,7 +314,6 @@ class TestMCPToolsIntegrationWorkflow:
             assert batch_scrape_tool is not None
             assert batch_convert_tool is not None
 
-    @pytest.mark.asyncio
     async def test_stealth_to_structured_data_workflow(self):
         """测试隐身爬取到结构化数据提取工作流"""
         with patch(
@@ -350,7 +334,6 @@ class TestMCPToolsIntegrationWorkflow:
             assert stealth_tool is not None
             assert structured_tool is not None
 
-    @pytest.mark.asyncio
     async def test_pdf_processing_workflow(self):
         """测试PDF处理工作流"""
         with patch(
@@ -371,7 +354,6 @@ class TestMCPToolsIntegrationWorkflow:
             pdf_tool = await app.get_tool("convert_pdf_to_markdown")
             assert pdf_tool is not None
 
-    @pytest.mark.asyncio
     async def test_server_management_workflow(self):
         """测试服务器管理工作流"""
         # 测试指标获取后清理缓存的工作流
@@ -385,7 +367,6 @@ class TestMCPToolsIntegrationWorkflow:
 class TestMCPToolsRobustnessAndReliability:
     """测试MCP工具的健壮性和可靠性"""
 
-    @pytest.mark.asyncio
     async def test_tools_handle_network_errors(self):
         """测试工具处理网络错误的能力"""
         with patch("extractor.scraper.WebScraper.scrape_url") as mock_scrape:
@@ -396,7 +377,6 @@ class TestMCPToolsRobustnessAndReliability:
             assert scrape_tool is not None
             # 工具应该存在并能够处理错误
 
-    @pytest.mark.asyncio
     async def test_tools_handle_invalid_parameters(self):
         """测试工具处理无效参数的能力"""
         # 所有工具都应该存在并有基本的错误处理
@@ -405,7 +385,6 @@ class TestMCPToolsRobustnessAndReliability:
             assert tool is not None, f"工具 {tool_name} 不应该为 None"
             assert hasattr(tool, "name"), f"工具 {tool_name} 应该有 name 属性"
 
-    @pytest.mark.asyncio
     async def test_concurrent_tool_access(self):
         """测试并发工具访问"""
 
@@ -425,7 +404,6 @@ class TestMCPToolsRobustnessAndReliability:
         for i, result in enumerate(results):
             assert result is not None, f"并发访问工具 {tool_names[i]} 失败"
 
-    @pytest.mark.asyncio
     async def test_tool_resource_cleanup(self):
         """测试工具资源清理"""
         # 验证工具在使用后能够正确清理资源
@@ -441,7 +419,6 @@ class TestMCPToolsRobustnessAndReliability:
 class TestMCPToolsPerformanceAndScalability:
     """测试MCP工具性能和可扩展性"""
 
-    @pytest.mark.asyncio
     async def test_tool_registration_performance(self):
         """测试工具注册性能"""
         import time
@@ -455,7 +432,6 @@ class TestMCPToolsPerformanceAndScalability:
         assert len(tools) == 14, "应该注册14个工具"
         assert registration_time < 1.0, f"工具注册时间 {registration_time:.2f}s 过长"
 
-    @pytest.mark.asyncio
     async def test_tool_access_performance(self):
         """测试工具访问性能"""
         import time
@@ -480,7 +456,6 @@ class TestMCPToolsPerformanceAndScalability:
             )
 
     @pytest.mark.slow
-    @pytest.mark.asyncio
     async def test_batch_tools_scalability(self):
         """测试批量工具可扩展性"""
         # 这个测试被标记为slow，只在完整测试时运行
@@ -12,7 +12,6 @@ CDP 命令和隐身脚本注入、浏览器启动失败等异常场景。
 WebDriverWait 元素等待功能、元素未找到等异常处理。
 """
 
-import pytest
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 
@@ -68,7 +67,6 @@ class TestAntiDetectionScraper:
         assert self.scraper.context is None
         assert self.scraper.playwright is None
 
-    @pytest.mark.asyncio
     async def test_invalid_stealth_method(self):
         """
         测试无效隐身方法的错误处理
@@ -83,7 +81,6 @@ class TestAntiDetectionScraper:
         assert "Unknown stealth method" in result["error"]
         assert result["url"] == "https://example.com"
 
-    @pytest.mark.asyncio
     async def test_scraping_exception_handling(self):
         """
         测试网络错误和异常处理
@@ -100,7 +97,6 @@ class TestAntiDetectionScraper:
             assert "error" in result
             assert "Network error" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_cleanup_called_after_scraping(self):
         """
         测试爬取后自动调用资源清理
@@ -153,7 +149,6 @@ class TestSeleniumStealth:
     @patch.object(AntiDetectionScraper, "_simulate_human_behavior_selenium")
     @patch.object(AntiDetectionScraper, "_extract_data_selenium")
     @patch("asyncio.sleep")
-    @pytest.mark.asyncio
     async def test_selenium_stealth_scraping_success(
         self,
         mock_sleep,
@@ -207,7 +202,6 @@ class TestSeleniumStealth:
     @patch("selenium.webdriver.support.ui.WebDriverWait")
     @patch.object(AntiDetectionScraper, "_scroll_page_selenium")
     @patch("asyncio.sleep")
-    @pytest.mark.asyncio
     async def test_selenium_stealth_with_scroll(
         self, mock_sleep, mock_scroll, mock_wait, mock_chrome
     ):
@@ -235,7 +229,6 @@ class TestSeleniumStealth:
     @patch("extractor.advanced_features.WebDriverWait")
     @patch("extractor.advanced_features.EC.presence_of_element_located")
     @patch("asyncio.sleep")
-    @pytest.mark.asyncio
     async def test_selenium_wait_for_element(
         self, mock_sleep, mock_presence, mock_wait, mock_chrome
     ):
@@ -263,7 +256,6 @@ class TestSeleniumStealth:
     @patch("extractor.advanced_features.random.randint")
     @patch("extractor.advanced_features.random.uniform")
     @patch("asyncio.sleep")
-    @pytest.mark.asyncio
     async def test_selenium_page_scrolling(
         self, mock_sleep, mock_uniform, mock_randint
     ):
@@ -295,7 +287,6 @@ class TestSeleniumStealth:
     @patch("extractor.advanced_features.random.randint")
     @patch("extractor.advanced_features.random.uniform")
     @patch("asyncio.sleep")
-    @pytest.mark.asyncio
     async def test_selenium_human_behavior_simulation(
         self, mock_sleep, mock_uniform, mock_randint, mock_action_chains
     ):
@@ -334,7 +325,6 @@ class TestPlaywrightStealth:
     @patch.object(AntiDetectionScraper, "_simulate_human_behavior_playwright")
     @patch.object(AntiDetectionScraper, "_extract_data_playwright")
     @patch("asyncio.sleep")
-    @pytest.mark.asyncio
     async def test_playwright_stealth_scraping_success(
         self, mock_sleep, mock_extract, mock_simulate, mock_scroll, mock_setup
     ):
@@ -369,7 +359,6 @@ class TestPlaywrightStealth:
 
     @patch.object(AntiDetectionScraper, "_setup_playwright_browser")
     @patch("asyncio.sleep")
-    @pytest.mark.asyncio
     async def test_playwright_wait_for_element(self, mock_sleep, mock_setup):
         """测试Playwright等待特定元素"""
         mock_page = AsyncMock()
@@ -392,7 +381,6 @@ class TestPlaywrightStealth:
 
             mock_page.wait_for_selector.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_playwright_page_scrolling(self):
         """测试Playwright页面滚动"""
         mock_page = AsyncMock()
@@ -410,7 +398,6 @@ class TestPlaywrightStealth:
     @patch("extractor.advanced_features.random.randint")
     @patch("extractor.advanced_features.random.uniform")
     @patch("asyncio.sleep")
-    @pytest.mark.asyncio
     async def test_playwright_human_behavior_simulation(
         self, mock_sleep, mock_uniform, mock_randint
     ):
@@ -445,7 +432,6 @@ class TestDataExtraction:
             pass
 
     @patch("bs4.BeautifulSoup")
-    @pytest.mark.asyncio
     async def test_selenium_data_extraction_default(self, mock_beautifulsoup):
         """测试Selenium默认数据提取"""
         # 模拟驱动器
@@ -475,7 +461,6 @@ class TestDataExtraction:
         assert result["content"]["links"] == []
 
     @patch("bs4.BeautifulSoup")
-    @pytest.mark.asyncio
     async def test_selenium_data_extraction_with_config(self, mock_beautifulsoup):
         """测试Selenium配置化数据提取"""
         mock_driver = Mock()
@@ -517,7 +502,6 @@ class TestDataExtraction:
         assert result["content"]["titles"] == ["Extracted text"]
         assert result["content"]["link"] == "href_value"
 
-    @pytest.mark.asyncio
     async def test_playwright_data_extraction_default(self):
         """测试Playwright默认数据提取"""
         mock_page = AsyncMock()
@@ -536,7 +520,6 @@ class TestDataExtraction:
         assert result["content"]["text"] == "Test content"
         assert result["content"]["links"] == []
 
-    @pytest.mark.asyncio
     async def test_playwright_data_extraction_with_config(self):
         """测试Playwright配置化数据提取"""
         mock_page = AsyncMock()
@@ -569,7 +552,6 @@ class TestDataExtraction:
 class TestResourceCleanup:
     """测试资源清理"""
 
-    @pytest.mark.asyncio
     async def test_cleanup_selenium_driver(self):
         """测试清理Selenium驱动器"""
         scraper = AntiDetectionScraper()
@@ -583,7 +565,6 @@ class TestResourceCleanup:
         mock_driver.quit.assert_called_once()
         assert scraper.driver is None
 
-    @pytest.mark.asyncio
     async def test_cleanup_playwright_resources(self):
         """测试清理Playwright资源"""
         scraper = AntiDetectionScraper()
@@ -611,7 +592,6 @@ class TestResourceCleanup:
         assert scraper.browser is None
         assert scraper.playwright is None
 
-    @pytest.mark.asyncio
     async def test_cleanup_with_none_resources(self):
         """测试清理空资源"""
         scraper = AntiDetectionScraper()
@@ -663,7 +643,6 @@ class TestFormHandler:
         assert handler.driver_or_page == mock_page
         assert handler.is_playwright is True
 
-    @pytest.mark.asyncio
     async def test_form_filling_success(self):
         """
         测试表单填充成功场景
@@ -698,7 +677,6 @@ class TestFormHandler:
             mock_fill_field.assert_any_call("#password", "testpass")
             mock_submit.assert_called_once_with("#submit")
 
-    @pytest.mark.asyncio
     async def test_form_filling_error(self):
         """
         测试表单填充错误处理
@@ -721,7 +699,6 @@ class TestSeleniumFormHandling:
     """测试Selenium表单处理"""
 
     @patch("extractor.advanced_features.Select")
-    @pytest.mark.asyncio
     async def test_selenium_fill_select_field(self, mock_select):
         """测试Selenium填充选择框"""
         mock_driver = Mock()
@@ -741,7 +718,6 @@ class TestSeleniumFormHandling:
         assert result["value"] == "Option 1"
         mock_select_instance.select_by_visible_text.assert_called_once_with("Option 1")
 
-    @pytest.mark.asyncio
     async def test_selenium_fill_checkbox(self):
         """测试Selenium填充复选框"""
         mock_driver = Mock()
@@ -759,7 +735,6 @@ class TestSeleniumFormHandling:
         assert result["value"] is True
         mock_element.click.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_selenium_fill_text_input(self):
         """测试Selenium填充文本输入"""
         mock_driver = Mock()
@@ -777,7 +752,6 @@ class TestSeleniumFormHandling:
         mock_element.clear.assert_called_once()
         mock_element.send_keys.assert_called_once_with("test value")
 
-    @pytest.mark.asyncio
     async def test_selenium_submit_form_with_button(self):
         """测试Selenium提交表单（指定按钮）"""
         mock_driver = Mock()
@@ -798,7 +772,6 @@ class TestSeleniumFormHandling:
 class TestPlaywrightFormHandling:
     """测试Playwright表单处理"""
 
-    @pytest.mark.asyncio
     async def test_playwright_fill_select_field(self):
         """测试Playwright填充选择框"""
         mock_page = AsyncMock()
@@ -816,7 +789,6 @@ class TestPlaywrightFormHandling:
         assert result["value"] == "Option 1"
         mock_element.select_option.assert_called_once_with(label="Option 1")
 
-    @pytest.mark.asyncio
     async def test_playwright_fill_checkbox(self):
         """测试Playwright填充复选框"""
         mock_page = AsyncMock()
@@ -835,7 +807,6 @@ class TestPlaywrightFormHandling:
         assert result["value"] is True
         mock_element.check.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_playwright_fill_text_input(self):
         """测试Playwright填充文本输入"""
         mock_page = AsyncMock()
@@ -853,7 +824,6 @@ class TestPlaywrightFormHandling:
         assert result["value"] == "test value"
         mock_element.fill.assert_called_once_with("test value")
 
-    @pytest.mark.asyncio
     async def test_playwright_fill_element_not_found(self):
         """测试Playwright元素未找到"""
         mock_page = AsyncMock()
@@ -867,7 +837,6 @@ class TestPlaywrightFormHandling:
         assert result["success"] is False
         assert result["error"] == "Element not found"
 
-    @pytest.mark.asyncio
     async def test_playwright_submit_form_with_button(self):
         """测试Playwright提交表单（指定按钮）"""
         mock_page = AsyncMock()
@@ -883,7 +852,6 @@ class TestPlaywrightFormHandling:
         assert result["new_url"] == "https://example.com/success"
         mock_page.click.assert_called_once_with("#submit-btn")
 
-    @pytest.mark.asyncio
     async def test_playwright_submit_form_auto_find(self):
         """测试Playwright自动查找提交按钮"""
         mock_page = AsyncMock()
@@ -907,7 +875,6 @@ class TestPlaywrightFormHandling:
 class TestFormHandlingErrorCases:
     """测试表单处理错误情况"""
 
-    @pytest.mark.asyncio
     async def test_selenium_field_not_found(self):
         """测试Selenium字段未找到"""
         mock_driver = Mock()
@@ -924,7 +891,6 @@ class TestFormHandlingErrorCases:
         assert result["success"] is False
         assert "Element not found" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_playwright_field_error(self):
         """测试Playwright字段操作错误"""
         mock_page = AsyncMock()
@@ -940,7 +906,6 @@ class TestFormHandlingErrorCases:
         assert result["success"] is False
         assert "Evaluation error" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_selenium_submit_no_button_found(self):
         """测试Selenium提交时找不到按钮"""
         mock_driver = Mock()
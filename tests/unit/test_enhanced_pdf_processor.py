@@ -46,7 +46,6 @@ class TestEnhancedPDFProcessor:
         assert len(asset_id) > 10  # Should include timestamp
 
     @patch("extractor.enhanced_pdf_processor.fitz")
-    @pytest.mark.asyncio
     async def test_extract_images_from_pdf_page(self, mock_fitz, processor):
         """Test image extraction from PDF page."""
         # Mock PDF document and page
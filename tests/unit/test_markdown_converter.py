@@ -124,6 +124,17 @@ class TestMarkdownConverter:
         assert "**bold**" in result
         assert "- Item 1" in result or "* Item 1" in result
 
+    def test_clean_html_conversion_skips_preprocessing_parse(self):
+        """测试干净HTML转换时跳过预处理解析"""
+        html_content = "<html><body><h1>Title</h1><p>Plain paragraph</p></body></html>"
+
+        with patch("extractor.markdown_converter.BeautifulSoup") as mock_soup:
+            result = self.converter.html_to_markdown(html_content)
+            mock_soup.assert_not_called()
+
+        assert "# Title" in result
+        assert "Plain paragraph" in result
+
     def test_link_conversion(self):
         """测试链接转换"""
         html_content = """
@@ -227,6 +238,35 @@ class TestPreprocessHTML:
         assert "alert" not in result
         assert "color: red" not in result
 
+    def test_script_with_markup_in_body_removal(self):
+        """测试脚本内含标签字符串时整体移除"""
+        html_content = """
+        <div>
+            <SCRIPT type="text/javascript">document.write("<p>injected</p>");</SCRIPT>
+            <p>Kept paragraph</p>
+            <style media="print">p { display: none; }</style >
+        </div>
+        """
+
+        result = self.converter.preprocess_html(html_content)
+
+        assert "Kept paragraph" in result
+        assert "injected" not in result
+        assert "display: none" not in result
+
+    def test_commented_out_script_keeps_content(self):
+        """测试注释中的脚本起始标签不会吞掉后续内容"""
+        html_content = (
+            '<!-- disabled: <script src="a.js"> --><p>Keep me please</p>'
+            "<script>x()</script>"
+        )
+
+        result = self.converter.preprocess_html(html_content)
+
+        assert "<p>Keep me please</p>" in result
+        assert "x()" not in result
+        assert "disabled" not in result
+
     def test_unwanted_elements_removal(self):
         """测试不需要元素的移除"""
         html_content = """
@@ -268,6 +308,39 @@ class TestPreprocessHTML:
         assert "https://example.com/page1" in result
         assert "https://example.com/images/logo.png" in result
 
+    def test_relative_url_conversion_without_parsing(self):
+        """测试仅需URL转换时直接改写属性"""
+        html_content = (
+            "<p><a href='docs/intro'>Intro</a> <a href=\"https://other.com/x\">X</a>"
+            ' <img alt="Pic" src=img/pic.png> <link href="/style.css"></p>'
+        )
+
+        with patch("extractor.markdown_converter.BeautifulSoup") as mock_soup:
+            result = self.converter.preprocess_html(
+                html_content, "https://example.com/guide/"
+            )
+            mock_soup.assert_not_called()
+
+        assert "href='https://example.com/guide/docs/intro'" in result
+        assert 'href="https://other.com/x"' in result
+        assert "src=https://example.com/guide/img/pic.png" in result
+        # 非 a/img 标签保持不变
+        assert '<link href="/style.css">' in result
+
+    def test_relative_url_conversion_with_quoted_gt(self):
+        """测试属性值中含有 ">" 或 "href=" 时仍正确改写"""
+        html_content = (
+            '<p><a data-x="1>2" href="/p">P</a>'
+            " <a title='see href=/q' href=\"/r\">R</a></p>"
+        )
+
+        result = self.converter.preprocess_html(html_content, "https://x.com")
+
+        assert 'href="https://x.com/p"' in result
+        assert 'data-x="1>2"' in result
+        assert "title='see href=/q'" in result
+        assert 'href="https://x.com/r"' in result
+
     def test_comment_removal(self):
         """测试HTML注释移除"""
         html_content = """
@@ -284,6 +357,16 @@ class TestPreprocessHTML:
         assert "This is a comment" not in result
         assert "Another comment" not in result
 
+    def test_clean_html_skips_parsing(self):
+        """测试无需处理的HTML直接返回"""
+        html_content = "<html><body><p>Test content</p></body></html>"
+
+        with patch("extractor.markdown_converter.BeautifulSoup") as mock_soup:
+            result = self.converter.preprocess_html(html_content)
+            mock_soup.assert_not_called()
+
+        assert result == html_content
+
     def test_empty_elements_cleanup(self):
         """测试空元素清理"""
         html_content = """
@@ -534,6 +617,28 @@ class TestWebpageConversion:
         assert "Content" in result["markdown"]
         assert result["url"] == "https://example.com"
 
+    def test_comment_marker_inside_script_keeps_content(self):
+        """测试脚本字符串中的注释标记不会吞掉正文"""
+        scrape_result = {
+            "url": "https://example.com",
+            "title": "Test Page",
+            "content": {
+                "html": (
+                    '<article><script>var s = "<!--";</script>'
+                    "<p>Keep this important paragraph text.</p>"
+                    "<!-- note --><p>Tail para</p></article>"
+                )
+            },
+        }
+
+        result = self.converter.convert_webpage_to_markdown(scrape_result)
+
+        assert result["success"] is True
+        assert "Keep this important paragraph text." in result["markdown"]
+        assert "Tail para" in result["markdown"]
+        assert "note" not in result["markdown"]
+        assert "var s" not in result["markdown"]
+
     def test_webpage_conversion_with_metadata(self):
         """测试带元数据的网页转换"""
         scrape_result = {
@@ -556,6 +661,9 @@ class TestWebpageConversion:
         assert result["metadata"]["title"] == "Test Page"
         assert result["metadata"]["meta_description"] == "Test description"
         assert result["metadata"]["word_count"] > 0
+        # 字数与字符数是精确统计（按空白分词），而非估算
+        assert result["metadata"]["word_count"] == len(result["markdown"].split())
+        assert result["metadata"]["character_count"] == len(result["markdown"])
         assert result["metadata"]["links_count"] == 1
         assert result["metadata"]["images_count"] == 1
 
@@ -612,6 +720,66 @@ class TestWebpageConversion:
         assert result["summary"]["failed"] == 1
         assert result["summary"]["success_rate"] == 2 / 3
 
+    def test_main_content_single_parse_matches_two_step(self):
+        """测试单次解析的主内容转换与分步转换结果一致"""
+        html_content = """
+        <html><body>
+            <nav>Site navigation</nav>
+            <article>
+                <h1>Article Title</h1>
+                <!-- hidden note -->
+                <p>Article body with a <a href="/more">relative link</a>.</p>
+                <div class="sidebar">Related posts</div>
+            </article>
+        </body></html>
+        """
+        base_url = "https://example.com/blog/"
+
+        two_step = MarkdownConverter().html_to_markdown(
+            MarkdownConverter().extract_content_area(html_content), base_url
+        )
+        result = self.converter.convert_webpage_to_markdown(
+            {"url": base_url, "content": {"html": html_content}}
+        )
+
+        assert result["markdown"] == two_step
+        assert "https://example.com/more" in result["markdown"]
+        assert "Related posts" not in result["markdown"]
+        assert "Site navigation" not in result["markdown"]
+
+    def test_webpage_conversion_disk_cache(self, tmp_path):
+        """测试可选的磁盘缓存复用转换结果"""
+        converter = MarkdownConverter(cache_dir=str(tmp_path))
+        scrape_result = {
+            "url": "https://example.com/cached",
+            "title": "Cached",
+            "etag": '"v1"',
+            "content": {"html": "<html><body><h1>Cached Page</h1></body></html>"},
+        }
+
+        first = converter.convert_webpage_to_markdown(scrape_result, use_cache=True)
+        assert first["success"] is True
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        with patch.object(converter, "_main_content_to_markdown") as mock_convert:
+            second = converter.convert_webpage_to_markdown(
+                scrape_result, use_cache=True
+            )
+            mock_convert.assert_not_called()
+        assert second == first
+
+        # ETag 变化或未启用缓存时重新转换
+        with patch.object(
+            converter,
+            "_main_content_to_markdown",
+            wraps=converter._main_content_to_markdown,
+        ) as mock_convert:
+            converter.convert_webpage_to_markdown(
+                {**scrape_result, "etag": '"v2"'}, use_cache=True
+            )
+            converter.convert_webpage_to_markdown(scrape_result)
+            assert mock_convert.call_count == 2
+
 
 class TestImageEmbedding:
     """测试图片嵌入功能"""
@@ -788,6 +956,37 @@ class TestPerformanceAndLimits:
         # 转换应该在合理时间内完成（5秒）
         assert conversion_time < 5.0
 
+    def test_repeated_conversion_uses_cache(self):
+        """测试相同HTML重复转换命中缓存"""
+        html_content = "<html><body><h1>Cached</h1><p>Same page</p></body></html>"
+
+        with patch.object(
+            self.converter._html_converter,
+            "convert",
+            wraps=self.converter._html_converter.convert,
+        ) as mock_convert:
+            first = self.converter.html_to_markdown(html_content)
+            second = self.converter.html_to_markdown(html_content)
+            assert first == second
+            assert mock_convert.call_count == 1
+
+            # 格式化选项变化时不应复用旧结果
+            self.converter.formatting_options["format_headings"] = False
+            self.converter.html_to_markdown(html_content)
+            assert mock_convert.call_count == 2
+
+    def test_content_area_cache(self):
+        """测试内容区域提取结果缓存"""
+        html_content = "<html><body><main><p>Main content here</p></main></body></html>"
+
+        first = self.converter.extract_content_area(html_content)
+        with patch("extractor.markdown_converter.BeautifulSoup") as mock_soup:
+            second = self.converter.extract_content_area(html_content)
+            mock_soup.assert_not_called()
+
+        assert first == second
+        assert "Main content here" in second
+
     def test_max_images_limit(self):
         """测试图片数量限制"""
         markdown_content = ""
@@ -13,11 +13,48 @@ Unit tests for WebScraper core functionality.
 不同方法的网页抓取、多 URL 并发抓取、网络错误和异常处理、响应时间、内容长度等元数据提取。
 """
 
+import asyncio
+from contextlib import ExitStack
+
 import pytest
+import soupsieve as sv
 from unittest.mock import patch, Mock
-from bs4 import BeautifulSoup
 
-from extractor.scraper import WebScraper
+from extractor.config import settings
+
+# Selectors compiled once and reused across tests
+_TITLE = sv.compile("title")
+_H1 = sv.compile("h1")
+_CONTENT_PARAGRAPHS = sv.compile(".content p")
+_LINK = sv.compile("a")
+_NONEXISTENT_ID = sv.compile("#nonexistent")
+_NONEXISTENT_CLASS = sv.compile(".nonexistent-class")
+
+# 模拟简单 HTTP 抓取返回的结果，测试中只读使用
+_MOCK_SIMPLE_RESULT = {
+    "url": "https://example.com/",
+    "status_code": 200,
+    "title": "Mock Page",
+    "content": {"text": "Mock Content", "links": [], "images": []},
+}
+_MOCK_EXTRACT_RESULT = {
+    **_MOCK_SIMPLE_RESULT,
+    "url": "https://example.com",
+    "extracted_data": {"title": "Mock Page"},
+}
+
+
+@pytest.fixture
+def stub_simple_scrape(scraper, monkeypatch):
+    """将 simple_scraper.scrape 直接替换为返回给定结果的协程函数"""
+
+    def stub(result):
+        async def scrape(url, extract_config=None):
+            return result
+
+        monkeypatch.setattr(scraper.simple_scraper, "scrape", scrape)
+
+    return stub
 
 
 class TestDataExtractor:
@@ -30,39 +67,33 @@ class TestDataExtractor:
     - **错误处理**: 测试不存在选择器的处理
     """
 
-    def test_simple_selector_extraction(self, sample_html):
+    def test_simple_selector_extraction(self, sample_soup):
         """测试基本 CSS 选择器数据提取"""
-        soup = BeautifulSoup(sample_html, "html.parser")
-
         # 简单文本选择器
-        title = soup.select_one("title").get_text()
+        title = _TITLE.select_one(sample_soup).get_text()
         assert title == "Test Page"
 
-        heading = soup.select_one("h1").get_text()
+        heading = _H1.select_one(sample_soup).get_text()
         assert heading == "Test Heading"
 
-    def test_multiple_element_extraction(self, sample_html):
+    def test_multiple_element_extraction(self, sample_soup):
         """测试多元素提取 (multiple: true 配置)"""
-        soup = BeautifulSoup(sample_html, "html.parser")
-
         # 多段落提取
-        paragraphs = soup.select(".content p")
+        paragraphs = _CONTENT_PARAGRAPHS.select(sample_soup)
         assert len(paragraphs) == 2
 
         # 提取所有链接
-        links = soup.select("a")
+        links = _LINK.select(sample_soup)
         assert len(links) >= 1
 
         # 验证多元素内容提取
         link_texts = [link.get_text() for link in links]
         assert any(link_texts)
 
-    def test_attribute_extraction(self, sample_html):
+    def test_attribute_extraction(self, sample_soup):
         """测试元素属性(href、src)提取"""
-        soup = BeautifulSoup(sample_html, "html.parser")
-
         # 提取链接 href 属性
-        link = soup.select_one("a")
+        link = _LINK.select_one(sample_soup)
         href = link.get("href")
         assert href == "https://example.com"
 
@@ -71,50 +102,17 @@ class TestDataExtractor:
             classes = link.get("class")
             assert isinstance(classes, list)
 
-    def test_nonexistent_selector_handling(self, sample_html):
+    def test_nonexistent_selector_handling(self, sample_soup):
         """测试不存在选择器的处理"""
-        soup = BeautifulSoup(sample_html, "html.parser")
-
         # 选择不存在的元素
-        nonexistent = soup.select_one("#nonexistent")
+        nonexistent = _NONEXISTENT_ID.select_one(sample_soup)
         assert nonexistent is None
 
         # 选择不存在的多个元素
-        nonexistent_multiple = soup.select(".nonexistent-class")
+        nonexistent_multiple = _NONEXISTENT_CLASS.select(sample_soup)
         assert len(nonexistent_multiple) == 0
 
 
-class TestBasicScraping:
-    """Test basic scraping functionality."""
-
-    def test_html_parsing(self, sample_html):
-        """Test HTML parsing with BeautifulSoup."""
-        soup = BeautifulSoup(sample_html, "html.parser")
-
-        title = soup.find("title")
-        assert title.get_text() == "Test Page"
-
-        links = soup.find_all("a")
-        assert len(links) >= 1
-        assert links[0].get("href") == "https://example.com"
-
-    def test_css_selector_extraction(self, sample_html):
-        """Test CSS selector based extraction."""
-        soup = BeautifulSoup(sample_html, "html.parser")
-
-        # Test simple selector
-        heading = soup.select_one("h1")
-        assert heading.get_text() == "Test Heading"
-
-        # Test multiple elements
-        paragraphs = soup.select(".content p")
-        assert len(paragraphs) == 2
-
-        # Test attribute extraction
-        link_href = soup.select_one("a")["href"]
-        assert link_href == "https://example.com"
-
-
 class TestWebScraper:
     """
     WebScraper 核心类测试
@@ -128,11 +126,6 @@ class TestWebScraper:
     - **元数据提取**: 测试响应时间、内容长度等元数据提取
     """
 
-    @pytest.fixture
-    def scraper(self):
-        """WebScraper instance for testing."""
-        return WebScraper()
-
     def test_scraper_initialization(self, scraper):
         """
         测试 WebScraper 实例的正确创建和配置加载
@@ -140,9 +133,14 @@ class TestWebScraper:
         验证 WebScraper 实例包含所有必要的组件 (scrapy_wrapper, selenium_scraper, simple_scraper)
         """
         assert scraper is not None
-        assert hasattr(scraper, "scrapy_wrapper")
-        assert hasattr(scraper, "selenium_scraper")
-        assert hasattr(scraper, "simple_scraper")
+        assert scraper.scrapy_wrapper is not None
+        assert scraper.selenium_scraper is not None
+        assert scraper.simple_scraper is not None
+
+        # 简单抓取的连接池大小与并发上限一致
+        adapter = scraper.simple_scraper.session.get_adapter("https://example.com")
+        pool_kw = adapter.poolmanager.connection_pool_kw
+        assert pool_kw["maxsize"] == settings.concurrent_requests
 
     def test_default_headers_generation(self, scraper):
         """
@@ -164,100 +162,161 @@ class TestWebScraper:
         else:
             pytest.skip("_get_default_headers method not found")
 
-    @pytest.mark.asyncio
-    async def test_method_selection_logic(self, scraper):
+    @pytest.mark.parametrize(
+        "method, backend",
+        [
+            ("auto", "simple_scraper"),
+            ("simple", "simple_scraper"),
+            ("scrapy", "scrapy_wrapper"),
+            ("selenium", "selenium_scraper"),
+        ],
+    )
+    async def test_method_selection(self, scraper, method, backend):
         """
-        测试自动方法选择逻辑 (auto/simple/scrapy/selenium)
+        测试抓取方法选择逻辑 (auto/simple/scrapy/selenium)
 
-        验证当 method="auto" 时，系统能够智能选择最合适的抓取方法
+        验证每种 method 都路由到对应的抓取组件，且 method="auto" 在未启用 JavaScript 时选择简单 HTTP 方法
         """
-        # Test that auto method defaults to something reasonable
-        with patch.object(scraper, "scrape_url") as mock_scrape:
-            mock_scrape.return_value = {"url": "test", "method": "simple"}
+        mock_result = {"url": "https://example.com", "status_code": 200}
+        backends = ("simple_scraper", "scrapy_wrapper", "selenium_scraper")
+
+        with ExitStack() as stack:
+            mock_settings = stack.enter_context(patch("extractor.scraper.settings"))
+            mock_settings.enable_javascript = False
+            mocks = {
+                name: stack.enter_context(
+                    patch.object(
+                        getattr(scraper, name),
+                        "scrape",
+                        return_value=[mock_result]
+                        if name == "scrapy_wrapper"
+                        else mock_result,
+                    )
+                )
+                for name in backends
+            }
 
-            # This should not raise an error
-            result = await scraper.scrape_url("https://example.com", method="auto")
+            result = await scraper.scrape_url("https://example.com", method=method)
 
-            # Verify method selection worked
-            assert mock_scrape.called
+        assert result == mock_result
+        mocks[backend].assert_awaited_once()
+        for name in backends:
+            if name != backend:
+                mocks[name].assert_not_awaited()
 
-    @pytest.mark.asyncio
-    async def test_scrape_url_simple_method(self, scraper):
+    async def test_scrape_url_simple_method(self, scraper, stub_simple_scrape):
         """
         测试简单 HTTP 方法抓取
 
         验证使用 method="simple" 时能够正确进行基本的 HTTP 请求并返回预期的数据结构
         """
-        # Mock the simple scraper
-        mock_result = {
-            "url": "https://example.com/",
-            "status_code": 200,
-            "title": "Mock Page",
-            "content": {"text": "Mock Content", "links": [], "images": []},
-        }
-
-        with patch.object(scraper.simple_scraper, "scrape", return_value=mock_result):
-            result = await scraper.scrape_url("https://example.com", method="simple")
+        stub_simple_scrape(_MOCK_SIMPLE_RESULT)
+        result = await scraper.scrape_url("https://example.com", method="simple")
 
-            assert result["url"] == "https://example.com/"
-            assert result["status_code"] == 200
-            assert "content" in result
+        assert result["url"] == "https://example.com/"
+        assert result["status_code"] == 200
+        assert "content" in result
 
-    @pytest.mark.asyncio
-    async def test_scrape_url_with_extraction(self, scraper):
+    async def test_scrape_url_with_extraction(self, scraper, stub_simple_scrape):
         """
         测试带数据提取配置的网页抓取
 
         验证当提供 extract_config 参数时，能够从页面中提取指定数据
         """
-        mock_result = {
-            "url": "https://example.com",
-            "status_code": 200,
-            "title": "Mock Page",
-            "content": {"text": "Mock Content", "links": [], "images": []},
-            "extracted_data": {"title": "Mock Page"},
-        }
-
-        with patch.object(scraper.simple_scraper, "scrape", return_value=mock_result):
-            result = await scraper.scrape_url(
-                "https://example.com",
-                method="simple",
-                extract_config={"title": "title"},
-            )
+        stub_simple_scrape(_MOCK_EXTRACT_RESULT)
+        result = await scraper.scrape_url(
+            "https://example.com",
+            method="simple",
+            extract_config={"title": "title"},
+        )
+
+        # Check if extracted_data exists or if title is directly available
+        if "extracted_data" in result:
+            assert result["extracted_data"]["title"] == "Mock Page"
+        else:
+            assert result["title"] == "Mock Page"
+
+    async def test_simple_scrape_reuses_session(
+        self, scraper, mock_http_response, monkeypatch
+    ):
+        """
+        测试简单抓取复用同一个 HTTP 会话
+
+        验证多次调用 scrape_url 时都通过 simple_scraper 持有的 requests.Session 发送请求，不会为每次请求新建会话
+        """
+        mock_http_response.content = mock_http_response.text.encode()
+        mock_get = Mock(return_value=mock_http_response)
+        monkeypatch.setattr(scraper.simple_scraper.session, "get", mock_get)
+        monkeypatch.setattr(
+            "extractor.scraper.requests.Session",
+            Mock(side_effect=AssertionError("unexpected new session")),
+        )
+
+        for _ in range(2):
+            result = await scraper.scrape_url("https://example.com", method="simple")
+            assert result["title"] == "Mock Page"
 
-            # Check if extracted_data exists or if title is directly available
-            if "extracted_data" in result:
-                assert result["extracted_data"]["title"] == "Mock Page"
-            else:
-                assert result["title"] == "Mock Page"
+        assert mock_get.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_scrape_multiple_urls(self, scraper):
         """
         测试多 URL 并发抓取
 
-        验证能够同时处理多个 URL，提高抓取效率，并返回正确的结果结构
+        验证多个 URL 通过 asyncio.gather 同时处理，并按输入顺序返回正确的结果结构
+        """
+        in_flight = 0
+        peak = 0
+        release = asyncio.Event()
+        urls = [f"https://example.com/{i}" for i in range(5)]
+
+        async def fake_scrape_url(url, method, extract_config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            if peak == len(urls):
+                release.set()
+            await release.wait()
+            in_flight -= 1
+            return {"url": url, "status_code": 200, "title": "Mock Page"}
+
+        with patch.object(scraper, "scrape_url", side_effect=fake_scrape_url):
+            results = await asyncio.wait_for(
+                scraper.scrape_multiple_urls(
+                    urls, method="simple", max_concurrency=len(urls)
+                ),
+                timeout=5,
+            )
+
+        assert peak == len(urls)
+        assert [r["url"] for r in results] == urls
+        assert all(r["status_code"] == 200 for r in results)
+
+    async def test_scrape_multiple_urls_bounded_concurrency(self, scraper):
+        """
+        测试多 URL 抓取的并发上限
+
+        验证同时进行的抓取数量不超过 max_concurrency，且所有 URL 最终都被处理
         """
-        mock_result = {
-            "url": "https://example.com",
-            "status_code": 200,
-            "title": "Mock Page",
-            "content": {"text": "Mock Content", "links": [], "images": []},
-        }
-
-        with patch.object(scraper, "scrape_url", return_value=mock_result):
-            urls = ["https://example.com", "https://test.com"]
-            results = await scraper.scrape_multiple_urls(urls, method="simple")
-
-            assert len(results) == 2
-            # Check the actual structure returned
-            if isinstance(results[0], dict) and "status_code" in results[0]:
-                assert all(r["status_code"] == 200 for r in results)
-            else:
-                # Results might be wrapped differently
-                assert len(results) == 2
-
-    @pytest.mark.asyncio
+        in_flight = 0
+        peak = 0
+        urls = [f"https://example.com/{i}" for i in range(10)]
+
+        async def fake_scrape_url(url, method, extract_config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"url": url, "status_code": 200}
+
+        with patch.object(scraper, "scrape_url", side_effect=fake_scrape_url):
+            results = await scraper.scrape_multiple_urls(
+                urls, method="simple", max_concurrency=3
+            )
+
+        assert peak == 3
+        assert [r["url"] for r in results] == urls
+
     async def test_scrape_url_error_handling(self, scraper):
         """
         测试网络错误和异常处理
@@ -302,63 +361,3 @@ class TestWebScraper:
         else:
             # Skip test if method doesn't exist
             pytest.skip("_extract_page_metadata method not found")
-
-    @pytest.mark.asyncio
-    async def test_scrapy_method_mock(self, scraper):
-        """Test Scrapy method execution (mocked)."""
-        # Check if the method exists before testing
-        if hasattr(scraper, "_run_scrapy_spider"):
-            with patch.object(scraper, "_run_scrapy_spider") as mock_spider:
-                mock_spider.return_value = [
-                    {"url": "https://example.com", "content": "test"}
-                ]
-
-                result = await scraper._scrape_with_scrapy("https://example.com")
-
-                assert result["url"] == "https://example.com"
-                assert result["content"] == "test"
-        elif hasattr(scraper, "scrapy_wrapper"):
-            # Test through the scrapy_wrapper component
-            mock_result = {
-                "url": "https://example.com",
-                "status_code": 200,
-                "content": {"text": "test content"},
-            }
-
-            with patch.object(
-                scraper.scrapy_wrapper, "scrape", return_value=[mock_result]
-            ):
-                result = await scraper.scrape_url(
-                    "https://example.com", method="scrapy"
-                )
-
-                assert result["url"] == "https://example.com"
-                assert result["status_code"] == 200
-        else:
-            # Skip test if neither method exists
-            pytest.skip("Scrapy method not found")
-
-    @pytest.mark.asyncio
-    async def test_method_selection_logic(self, scraper):
-        """Test automatic method selection logic."""
-        # Test that auto method defaults to something reasonable
-        with patch.object(scraper, "scrape_url") as mock_scrape:
-            mock_scrape.return_value = {"url": "test", "method": "simple"}
-
-            # This should not raise an error
-            result = await scraper.scrape_url("https://example.com", method="auto")
-
-            # Verify method selection worked
-            assert mock_scrape.called
-
-    def test_scraper_attributes(self, scraper):
-        """Test that scraper has expected attributes."""
-        # Test that the main components exist
-        assert hasattr(scraper, "simple_scraper")
-        assert hasattr(scraper, "scrapy_wrapper")
-        assert hasattr(scraper, "selenium_scraper")
-
-        # These components should not be None
-        assert scraper.simple_scraper is not None
-        assert scraper.scrapy_wrapper is not None
-        assert scraper.selenium_scraper is not None
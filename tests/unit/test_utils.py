@@ -3,7 +3,7 @@
 
 ### RateLimiter 限流器测试
 
-测试请求频率限制、时间窗口清理、多请求并发限流效果。
+测试请求频率限制、空闲后立即放行、多请求并发限流效果。
 
 ### RetryManager 重试管理器测试
 
@@ -22,10 +22,12 @@
 测试 URL 格式验证 (http/https)、HTML 标签移除和空白符处理、数据提取配置格式验证、异步函数执行时间测量。
 """
 
-import pytest
 import asyncio
-import time
-from unittest.mock import patch, AsyncMock
+import logging
+import random
+import pytest
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
 
 from extractor.utils import (
     RateLimiter,
@@ -44,16 +46,27 @@ from extractor.utils import (
 )
 
 
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Stub asyncio.sleep so rate-limit and retry waits return at once."""
+    sleep = AsyncMock()
+    monkeypatch.setattr("extractor.utils.asyncio.sleep", sleep)
+    return sleep
+
+
 class TestRateLimiter:
     """
     RateLimiter 限流器测试
 
     - **限流边界测试**: 测试请求频率限制
-    - **时间窗口清理**: 测试过期请求时间戳清理
+    - **空闲放行**: 测试超过最小间隔后请求立即放行
     - **并发限流**: 测试多请求并发限流效果
     """
 
-    def test_rate_limiter_initialization(self):
+    @pytest.mark.parametrize(
+        "requests_per_second, min_interval", [(1.0, 1.0), (2.0, 0.5)]
+    )
+    def test_rate_limiter_initialization(self, requests_per_second, min_interval):
         """
         测试限流器初始化
 
@@ -62,13 +75,12 @@ class TestRateLimiter:
         - 最小间隔时间计算正确
         - 初始请求时间戳为 0
         """
-        limiter = RateLimiter(requests_per_second=1.0)
-        assert limiter.requests_per_second == 1.0
-        assert limiter.min_interval == 1.0
+        limiter = RateLimiter(requests_per_second=requests_per_second)
+        assert limiter.requests_per_second == requests_per_second
+        assert limiter.min_interval == min_interval
         assert limiter.last_request_time == 0.0
 
-    @pytest.mark.asyncio
-    async def test_rate_limiting_within_limit(self):
+    async def test_rate_limiting_within_limit(self, fake_sleep):
         """
         测试在限制范围内的请求处理
 
@@ -76,40 +88,63 @@ class TestRateLimiter:
         """
         limiter = RateLimiter(requests_per_second=60.0)
 
-        start_time = time.time()
         await limiter.wait()
-        end_time = time.time()
 
         # Should not be delayed when within limit
-        assert (end_time - start_time) < 0.1
+        fake_sleep.assert_not_awaited()
 
-    @pytest.mark.asyncio
-    async def test_rate_limiting_exceeds_limit(self):
+    async def test_rate_limiting_exceeds_limit(self, fake_sleep, monkeypatch):
         """
         测试超过频率限制时的限流效果
 
         验证当请求频率超过限制时，后续请求会被适当延迟，防止对目标服务器造成压力
         """
         limiter = RateLimiter(requests_per_second=10.0)  # Higher limit for testing
+        # Second request arrives 20ms after the first
+        monkeypatch.setattr(
+            "extractor.utils.time", Mock(monotonic=Mock(side_effect=[100.0, 100.02]))
+        )
 
         # Make two quick requests
-        start_time = time.time()
         await limiter.wait()
         await limiter.wait()
-        end_time = time.time()
 
-        # Second request should be slightly delayed
-        assert (end_time - start_time) >= 0.0  # Some delay expected
+        # Second request should wait out the rest of the 100ms interval
+        fake_sleep.assert_awaited_once()
+        assert fake_sleep.await_args.args[0] == pytest.approx(0.08)
+
+    async def test_rate_limiting_concurrent_requests(self, fake_sleep, monkeypatch):
+        """
+        测试并发请求的限流效果
+
+        验证同时到达的请求依次占用时间槽，而不是在同一时刻一起放行
+        """
+        limiter = RateLimiter(requests_per_second=10.0)
+        monkeypatch.setattr(
+            "extractor.utils.time", Mock(monotonic=Mock(return_value=100.0))
+        )
+
+        await asyncio.gather(limiter.wait(), limiter.wait(), limiter.wait())
 
-    def test_cleanup_old_requests(self):
+        delays = [call.args[0] for call in fake_sleep.await_args_list]
+        assert delays == [pytest.approx(0.1), pytest.approx(0.2)]
+
+    async def test_rate_limiting_after_idle_period(self, fake_sleep, monkeypatch):
         """
-        测试过期请求时间戳清理
+        测试空闲后的请求处理
 
-        验证限流器能够正确管理时间戳，清理过期的请求记录以防止内存泄漏
+        验证距上次请求已超过最小间隔时，请求立即放行且记录新的请求时间
         """
         limiter = RateLimiter(requests_per_second=1.0)
-        # Test that old timestamps are properly managed
-        assert limiter.last_request_time == 0.0
+        monkeypatch.setattr(
+            "extractor.utils.time", Mock(monotonic=Mock(side_effect=[100.0, 101.5]))
+        )
+
+        await limiter.wait()
+        await limiter.wait()
+
+        fake_sleep.assert_not_awaited()
+        assert limiter.last_request_time == 101.5
 
 
 class TestRetryManager:
@@ -121,7 +156,6 @@ class TestRetryManager:
         assert manager.max_retries == 3
         assert manager.base_delay == 1.0
 
-    @pytest.mark.asyncio
     async def test_retry_success_first_attempt(self):
         """Test retry when operation succeeds on first attempt."""
         manager = RetryManager(max_retries=3)
@@ -133,41 +167,61 @@ class TestRetryManager:
         assert result == "success"
         assert mock_func.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_retry_success_after_failures(self):
+    async def test_retry_success_after_failures(self, fake_sleep):
         """Test retry when operation succeeds after failures."""
-        manager = RetryManager(max_retries=3, base_delay=0.01)  # Very short delay
+        manager = RetryManager(max_retries=3, base_delay=1.0, jitter=0.0)
 
-        mock_func = AsyncMock()
-        mock_func.side_effect = [Exception("Error 1"), Exception("Error 2"), "success"]
+        calls = 0
 
-        result = await manager.retry_async(mock_func)
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise ConnectionError(f"Error {calls}")
+            return "success"
+
+        result = await manager.retry_async(flaky)
 
         assert result == "success"
-        assert mock_func.call_count == 3
+        assert calls == 3
+        # Exponential backoff between attempts
+        assert [c.args[0] for c in fake_sleep.await_args_list] == [1.0, 2.0]
 
-    @pytest.mark.asyncio
-    async def test_retry_exhausted(self):
+    async def test_retry_exhausted(self, fake_sleep):
         """Test retry when all attempts are exhausted."""
         manager = RetryManager(max_retries=2, base_delay=0.01)
 
-        mock_func = AsyncMock(side_effect=Exception("Persistent error"))
+        calls = 0
 
-        with pytest.raises(Exception, match="Persistent error"):
-            await manager.retry_async(mock_func)
+        async def always_fails():
+            nonlocal calls
+            calls += 1
+            raise TimeoutError(f"Attempt {calls}")
 
-        assert mock_func.call_count == 3  # Initial + 2 retries
+        with pytest.raises(TimeoutError) as exc_info:
+            await manager.retry_async(always_fails)
+
+        assert calls == 3  # Initial + 2 retries
+        # The error from the final attempt is the one re-raised
+        assert exc_info.value.args == ("Attempt 3",)
+        assert fake_sleep.await_count == 2  # No wait after the final attempt
 
     def test_calculate_delay_exponential_backoff(self):
         """Test exponential backoff delay calculation."""
-        manager = RetryManager(base_delay=1.0, backoff_factor=2.0)
+        manager = RetryManager(base_delay=1.0, backoff_factor=2.0, jitter=0.0)
+
+        assert manager._calculate_delay(1) == 2.0
+        assert manager._calculate_delay(2) == 4.0
+
+    def test_calculate_delay_jitter(self):
+        """Test jitter spreads the delay within bounds around the backoff."""
+        manager = RetryManager(base_delay=1.0, backoff_factor=2.0, jitter=0.25)
+        rng = random.Random(0)
 
-        # Test internal delay calculation logic
-        delay_1 = manager.base_delay * (manager.backoff_factor**1)
-        delay_2 = manager.base_delay * (manager.backoff_factor**2)
+        delays = [manager._calculate_delay(1, rng) for _ in range(50)]
 
-        assert delay_1 == 2.0
-        assert delay_2 == 4.0
+        assert all(1.5 <= delay <= 2.5 for delay in delays)
+        assert len(set(delays)) > 1
 
 
 class TestCacheManager:
@@ -200,12 +254,30 @@ class TestCacheManager:
         # Should be available immediately
         assert manager.get("expire_url", "simple") == test_data
 
-        # Wait for expiration
-        time.sleep(1.1)
+        # Backdate the entry past its TTL instead of sleeping
+        key = manager._generate_key("expire_url", "simple")
+        manager.timestamps[key] -= timedelta(seconds=1.1)
 
         # Should be None after expiration
         assert manager.get("expire_url", "simple") is None
 
+    def test_cache_evicts_least_recently_used(self):
+        """Test eviction drops the least recently used entry."""
+        manager = CacheManager(max_size=2)
+
+        manager.set("url1", "simple", {"value": 1})
+        manager.set("url2", "simple", {"value": 2})
+        # Touch url1 so url2 becomes the eviction candidate
+        assert manager.get("url1", "simple") == {"value": 1}
+
+        manager.set("url3", "simple", {"value": 3})
+
+        assert len(manager.cache) == 2
+        assert len(manager.timestamps) == 2
+        assert manager.get("url2", "simple") is None
+        assert manager.get("url1", "simple") == {"value": 1}
+        assert manager.get("url3", "simple") == {"value": 3}
+
     def test_cache_miss(self):
         """Test cache miss behavior."""
         manager = CacheManager()
@@ -290,6 +362,7 @@ class TestMetricsCollector:
         assert stats["successful_requests"] == 1
         assert stats["failed_requests"] == 1
         assert stats["success_rate"] == 0.5
+        assert stats["methods_used"] == {"simple": 1, "scrapy": 1}
 
     def test_reset_metrics(self):
         """Test resetting metrics."""
@@ -310,65 +383,62 @@ class TestErrorHandler:
         # ErrorHandler is a static class, test its static methods
         assert hasattr(ErrorHandler, "handle_scraping_error")
 
-    def test_categorize_error_timeout(self):
-        """Test timeout error categorization."""
-        timeout_error = Exception("Request timeout")
-        result = ErrorHandler.handle_scraping_error(
-            timeout_error, "https://example.com", "simple"
-        )
-
-        assert result["success"] is False
-        assert result["error"]["category"] == "timeout"
-
-    def test_categorize_error_connection(self):
-        """Test connection error categorization."""
-        connection_error = Exception("Connection refused")
+    @pytest.mark.parametrize(
+        "message, category",
+        [
+            ("Request timeout", "timeout"),
+            ("Connection refused", "connection"),
+            ("HTTP 404 returned", "not_found"),
+            ("HTTP 403 returned", "forbidden"),
+            ("Blocked by Cloudflare", "anti_bot"),
+            ("Something else", "unknown"),
+            # The first matching category wins when several apply
+            ("Connection timeout after 403 from Cloudflare", "timeout"),
+        ],
+    )
+    def test_categorize_error(self, message, category):
+        """Test error categorization from the exception message."""
         result = ErrorHandler.handle_scraping_error(
-            connection_error, "https://example.com", "simple"
+            Exception(message), "https://example.com", "simple"
         )
 
         assert result["success"] is False
-        assert result["error"]["category"] == "connection"
+        assert result["error"]["category"] == category
 
-    def test_handle_error_logging(self):
+    def test_handle_error_logging(self, caplog):
         """Test error handling and logging."""
         error = Exception("Test error")
 
-        with patch("extractor.utils.logger") as mock_logger:
+        with caplog.at_level(logging.ERROR, logger="extractor.utils"):
             result = ErrorHandler.handle_scraping_error(
                 error, "https://example.com", "simple"
             )
 
-            mock_logger.error.assert_called_once()
-            assert result["success"] is False
-
-    def test_should_retry_decision(self):
-        """Test retry decision logic based on error categories."""
-        # Test different error types
-        timeout_result = ErrorHandler.handle_scraping_error(
-            Exception("timeout"), "https://example.com", "simple"
-        )
-        assert timeout_result["error"]["category"] == "timeout"
-
-        connection_result = ErrorHandler.handle_scraping_error(
-            Exception("connection failed"), "https://example.com", "simple"
-        )
-        assert connection_result["error"]["category"] == "connection"
+        assert result["success"] is False
+        assert [record.getMessage() for record in caplog.records] == [
+            "Scraping error for https://example.com using simple: Exception: Test error"
+        ]
 
 
 class TestUtilityFunctions:
     """Test standalone utility functions."""
 
-    def test_url_validator_valid_urls(self):
-        """Test URLValidator with valid URLs."""
-        assert URLValidator.is_valid_url("https://example.com") is True
-        assert URLValidator.is_valid_url("http://test.org/path?query=value") is True
-        assert URLValidator.is_valid_url("https://sub.domain.com:8080") is True
-
-    def test_url_validator_invalid_urls(self):
-        """Test URLValidator with invalid URLs."""
-        assert URLValidator.is_valid_url("not-a-url") is False
-        assert URLValidator.is_valid_url("") is False
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://example.com", True),
+            ("http://test.org/path?query=value", True),
+            ("https://sub.domain.com:8080", True),
+            ("not-a-url", False),
+            ("", False),
+            ("ftp://example.com", False),
+            ("http://", False),
+            ("https://exa mple.com", False),
+        ],
+    )
+    def test_url_validator(self, url, expected):
+        """Test URLValidator accepts only well-formed http(s) URLs."""
+        assert URLValidator.is_valid_url(url) is expected
 
     def test_text_cleaner_clean_text(self):
         """Test TextCleaner text cleaning."""
@@ -404,19 +474,35 @@ class TestUtilityFunctions:
         with pytest.raises(ValueError):
             ConfigValidator.validate_extract_config(invalid_config)
 
-    @pytest.mark.asyncio
-    async def test_timing_decorator(self):
+    async def test_timing_decorator(self, monkeypatch):
         """Test timing decorator functionality."""
+        monkeypatch.setattr(
+            "extractor.utils.time", Mock(time=Mock(side_effect=[10.0, 10.25]))
+        )
 
         @timing_decorator
         async def test_function():
-            await asyncio.sleep(0.01)  # Short sleep
             return {"data": "result"}
 
         result = await test_function()
 
         assert result["data"] == "result"
-        assert "duration_ms" in result
+        assert result["duration_ms"] == 250
+
+    def test_timing_decorator_sync(self, monkeypatch):
+        """Test timing decorator works with sync functions."""
+        monkeypatch.setattr(
+            "extractor.utils.time", Mock(time=Mock(side_effect=[10.0, 10.25]))
+        )
+
+        @timing_decorator
+        def test_function():
+            return {"data": "result"}
+
+        result = test_function()
+
+        assert result["data"] == "result"
+        assert result["duration_ms"] == 250
 
     def test_global_instances(self):
         """Test global utility instances are properly initialized."""